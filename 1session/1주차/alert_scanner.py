@@ -0,0 +1,182 @@
+import argparse
+import json
+import os
+from collections import Counter, deque
+
+from fast_parser import decode_fields, split_line
+
+# 기본 경보 문구 목록 (이 파일과 같은 폴더)
+DEFAULT_PATTERNS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'alert_patterns.json')
+
+
+def _is_word_char(char):
+    return char.isalnum() or char == '_'
+
+
+class AhoCorasick:
+    """
+    여러 문구를 하나의 오토마톤으로 묶어 한 번의 순회로 모두 찾는다.
+    문구 개수와 상관없이 한 줄은 글자 수만큼만 훑는다.
+    단어 경계에 걸친 매칭만 인정한다. ('fire' 는 'fired', 'leak' 은 'bleak' 에 매칭되지 않음)
+    """
+
+    def __init__(self, phrases):
+        self.goto = [{}]       # 상태별 전이 (글자 → 다음 상태)
+        self.fail = [0]        # 실패 링크
+        # 상태에 도달하면 매칭되는 (문구 번호, 길이, 앞 경계 확인 여부, 뒤 경계 확인 여부) 들
+        self.output = [[]]
+
+        for number, phrase in enumerate(phrases):
+            state = 0
+            for char in phrase:
+                next_state = self.goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append([])
+                    self.goto[state][char] = next_state
+                state = next_state
+            # 문구 끝 글자가 단어 글자일 때만 경계를 확인 (예: 'liftoff!' 의 뒤는 확인하지 않음)
+            self.output[state].append(
+                (number, len(phrase), _is_word_char(phrase[0]), _is_word_char(phrase[-1]))
+            )
+
+        # 너비 우선으로 실패 링크 계산
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[next_state] = self.goto[fallback].get(char, 0)
+                self.output[next_state] = self.output[next_state] + self.output[self.fail[next_state]]
+
+    def search(self, text):
+        # text 에 들어 있는 문구 번호 집합
+        found = set()
+        state = 0
+        goto = self.goto
+        fail = self.fail
+        last = len(text) - 1
+        for end, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for number, length, check_start, check_end in self.output[state]:
+                start = end - length + 1
+                if check_start and start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                if check_end and end < last and _is_word_char(text[end + 1]):
+                    continue
+                found.add(number)
+        return found
+
+
+def load_patterns(path=DEFAULT_PATTERNS):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def scan_logs(log_paths, patterns):
+    """
+    로그들을 한 번씩만 읽으면서 모든 경보 문구를 찾는다.
+    반환값: (timestamp, event, message, 매칭된 패턴 목록) 의 시간순 목록
+    """
+    automaton = AhoCorasick([pattern['phrase'].lower() for pattern in patterns])
+    matches = []
+    for log_path in log_paths:
+        with open(log_path, 'rb') as f:
+            for line in f:
+                fields = split_line(line.rstrip(b'\r\n'))
+                if fields is None:
+                    continue
+                timestamp, event, message = decode_fields(fields)
+                found = automaton.search(message.lower())
+                if found:
+                    hits = [patterns[number] for number in sorted(found)]
+                    matches.append((timestamp, event, message, hits))
+    matches.sort(key=lambda match: match[0])
+    return matches
+
+
+def build_report(matches):
+    milestones = [m for m in matches if any(p['category'] == 'milestone' for p in m[3])]
+    anomalies = [m for m in matches if any(p['category'] == 'anomaly' for p in m[3])]
+
+    lines = ['# 로켓 미션 로그 분석 보고서', '']
+
+    lines.append('## 1. 사고 개요')
+    if anomalies:
+        first, last = anomalies[0], anomalies[-1]
+        lines.append(
+            f"{first[0]} 에 **{first[2]}** 이(가) 처음 감지되었고, "
+            f"총 {len(anomalies)}건의 이상 징후가 기록되었습니다. "
+            f"마지막 이상 징후는 {last[0]} 의 **{last[2]}** 입니다."
+        )
+    else:
+        lines.append('이상 징후가 감지되지 않았습니다.')
+    lines.append('')
+
+    lines.append('## 2. 로그 분석')
+    lines.append('### 정상 진행 과정')
+    for timestamp, event, message, hits in milestones:
+        label = ', '.join(p['label'] for p in hits if p['category'] == 'milestone')
+        lines.append(f'- **{timestamp[11:]}** - {label}')
+    lines.append('')
+
+    lines.append('### 이상 징후 발생')
+    for timestamp, event, message, hits in anomalies:
+        label = ', '.join(p['label'] for p in hits if p['category'] == 'anomaly')
+        lines.append(f'- **{timestamp[11:]}** - `{event}, {message}` ({label})')
+    lines.append('')
+
+    lines.append('## 3. 경보 통계')
+    severity_count = Counter()
+    phrase_count = Counter()
+    for match in anomalies:
+        for pattern in match[3]:
+            if pattern['category'] == 'anomaly':
+                severity_count[pattern['severity']] += 1
+                phrase_count[pattern['phrase']] += 1
+    if phrase_count:
+        lines.append('| 문구 | 횟수 |')
+        lines.append('|---|---|')
+        for phrase, count in phrase_count.most_common():
+            lines.append(f'| {phrase} | {count} |')
+        lines.append('')
+        for severity, count in severity_count.most_common():
+            lines.append(f'- {severity}: {count}건')
+    else:
+        lines.append('- 해당 없음')
+    lines.append('')
+
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='미션 로그 경보 스캐너 / 보고서 생성')
+    parser.add_argument('logs', nargs='+', help='분석할 로그 파일들')
+    parser.add_argument('--patterns', default=DEFAULT_PATTERNS, help='경보 문구 목록 (JSON)')
+    parser.add_argument('--output', default='log_analysis.md', help='보고서 저장 경로')
+    args = parser.parse_args()
+
+    try:
+        patterns = load_patterns(args.patterns)
+        matches = scan_logs(args.logs, patterns)
+        report = build_report(matches)
+
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(report)
+        print(f'보고서 생성 완료: {args.output} (매칭 {len(matches)}건)')
+
+    except FileNotFoundError as e:
+        print(f'파일을 찾을 수 없습니다: {e.filename}')
+    except json.JSONDecodeError as e:
+        print(f'경보 문구 목록 형식이 잘못되었습니다: {e}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+import argparse
+import calendar
+import csv
+import os
+import random
+import tempfile
+import time
+from datetime import datetime
+
+from fast_parser import iter_records, timestamp_to_epoch
+
+MESSAGES = [
+    'Rocket initialization process started.',
+    'Power systems online. Batteries at optimal charge.',
+    'Navigation systems show nominal performance.',
+    'Oxygen tank unstable.',
+    'Oxygen tank explosion.'
+]
+
+
+def make_log(path, lines):
+    # 합성 로그 생성 (1초 ~ 3초 간격)
+    epoch = timestamp_to_epoch('2023-08-27 00:00:00')
+    rng = random.Random(0)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('timestamp,event,message\n')
+        for _ in range(lines):
+            epoch += rng.randint(1, 3)
+            ts = time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(epoch))
+            f.write(f'{ts},{rng.choice(("INFO", "WARN", "ERROR"))},{rng.choice(MESSAGES)}\n')
+
+
+def naive_parse(path):
+    # 비교 대상: csv + strptime (fast_parser 와 같이 UTC 로 해석)
+    count = 0
+    total = 0
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        next(reader)
+        for row in reader:
+            total += calendar.timegm(datetime.strptime(row[0], '%Y-%m-%d %H:%M:%S').timetuple())
+            count += 1
+    return count, total
+
+
+def fast_parse(path):
+    count = 0
+    total = 0
+    for epoch, _, _ in iter_records(path):
+        total += epoch
+        count += 1
+    return count, total
+
+
+def measure(name, func, path):
+    start = time.perf_counter()
+    count, total = func(path)
+    elapsed = time.perf_counter() - start
+    print(f'{name:>12}: {count}줄, {elapsed:.2f}초 ({count / elapsed:,.0f}줄/초)')
+    return elapsed, total
+
+
+def main():
+    parser = argparse.ArgumentParser(description='로그 파서 성능 비교')
+    parser.add_argument('--lines', type=int, default=10_000_000, help='합성 로그 줄 수')
+    args = parser.parse_args()
+
+    fd, path = tempfile.mkstemp(suffix='.log')
+    os.close(fd)
+    try:
+        print(f'합성 로그 생성 중... ({args.lines}줄)')
+        make_log(path, args.lines)
+
+        naive, naive_total = measure('csv+strptime', naive_parse, path)
+        fast, fast_total = measure('fast_parser', fast_parse, path)
+        # 두 방식의 epoch 값이 같아야 비교가 의미 있음
+        if naive_total != fast_total:
+            print('경고: 두 파서의 시각 변환 결과가 다릅니다.')
+        print(f'속도 향상: {naive / fast:.1f}배')
+    finally:
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
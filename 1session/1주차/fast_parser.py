@@ -0,0 +1,98 @@
+"""
+timestamp,event,message 로그용 공용 고속 파서.
+- bytes 그대로 구분자 위치를 찾아 자름 (csv 모듈, 문자열 디코딩 없이)
+- 'YYYY-MM-DD HH:MM:SS' 고정 폭 시각을 strptime 대신 슬라이싱과 산술로 epoch 정수로 변환
+- 결과는 (epoch, event, message) 튜플
+"""
+
+HEADER = b'timestamp,event,message'
+
+# 읽기 버퍼 크기
+CHUNK_SIZE = 1024 * 1024
+
+# 날짜 부분('YYYY-MM-DD') → 그날 0시의 epoch 초 캐시
+_day_cache = {}
+
+
+def days_from_civil(year, month, day):
+    # 1970-01-01 부터 지난 일수 (그레고리력, 윤년 포함)
+    if month <= 2:
+        year -= 1
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * (month + (-3 if month > 2 else 9)) + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    return era * 146097 + day_of_era - 719468
+
+
+def timestamp_to_epoch(ts):
+    """b'2023-08-27 11:35:00' (또는 str) → 1693136100 (UTC 기준)"""
+    if isinstance(ts, str):
+        ts = ts.encode('ascii')
+    date = ts[:10]
+    base = _day_cache.get(date)
+    if base is None:
+        base = days_from_civil(int(ts[0:4]), int(ts[5:7]), int(ts[8:10])) * 86400
+        _day_cache[date] = base
+    return base + int(ts[11:13]) * 3600 + int(ts[14:16]) * 60 + int(ts[17:19])
+
+
+def split_line(line):
+    """
+    한 줄(bytes, 개행 제외) → (timestamp, event, message) bytes 그대로.
+    형식이 아니면 (헤더 포함) None. 시각 문자열이 필요한 도구용.
+    """
+    if line[19:20] != b',':
+        return None
+    second = line.find(b',', 20)
+    if second < 0:
+        return None
+    return line[:19], line[20:second], line[second + 1:]
+
+
+def decode_fields(fields, encoding='utf-8'):
+    # split_line 결과 → 문자열 튜플
+    return tuple(field.decode(encoding) for field in fields)
+
+
+def parse_line(line):
+    """한 줄(bytes, 개행 제외) → (epoch, event, message). 형식이 아니면 None"""
+    fields = split_line(line)
+    if fields is None:
+        return None
+    return timestamp_to_epoch(fields[0]), fields[1], fields[2]
+
+
+def iter_records(file_path, chunk_size=CHUNK_SIZE):
+    # 파일을 큰 덩어리로 읽으면서 (epoch, event, message) 를 차례로 반환
+    events = {}
+    # 로그는 시간순이므로 직전 줄과 같은 '분'이면 계산을 재사용
+    last_minute = None
+    base = 0
+    with open(file_path, 'rb') as f:
+        remainder = b''
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            lines = (remainder + chunk).split(b'\n')
+            remainder = lines.pop()
+            for line in lines:
+                # 구분자 위치가 고정이 아니면 (헤더 등) 건너뜀
+                if line[19:20] != b',':
+                    continue
+                second = line.find(b',', 20)
+                if second < 0:
+                    continue
+                minute = line[:16]
+                if minute != last_minute:
+                    last_minute = minute
+                    base = timestamp_to_epoch(minute + b':00')
+                event = line[20:second]
+                # 같은 이벤트 레벨은 같은 bytes 객체를 재사용
+                event = events.setdefault(event, event)
+                yield base + int(line[17:19]), event, line[second + 1:].rstrip(b'\r')
+        if remainder:
+            record = parse_line(remainder.rstrip(b'\r'))
+            if record is not None:
+                yield record
@@ -0,0 +1,235 @@
+import argparse
+import json
+import os
+import struct
+import zlib
+from array import array
+from collections import Counter
+from datetime import datetime, timezone
+
+from fast_parser import iter_records, timestamp_to_epoch
+
+MAGIC = b'MLOGCOL1'
+
+# 블록 하나에 담을 줄 수
+BLOCK_ROWS = 65536
+
+HEADER = 'timestamp,event,message'
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def to_epoch(timestamp):
+    return timestamp_to_epoch(timestamp)
+
+
+def from_epoch(epoch):
+    return datetime.fromtimestamp(epoch, timezone.utc).strftime(TIME_FORMAT)
+
+
+def _pack(values, typecode):
+    return zlib.compress(array(typecode, values).tobytes())
+
+
+def _unpack(data, typecode):
+    values = array(typecode)
+    values.frombytes(zlib.decompress(data))
+    return values
+
+
+class ArchiveWriter:
+    """
+    timestamp,event,message 로그를 열 단위 압축 아카이브로 저장한다.
+    - timestamp: 블록 첫 값 + 차이값(델타) 정수 배열
+    - event: 파일 전체 사전(dictionary) 번호
+    - message: 블록별 사전 + 번호 (사전 문자열은 zlib 압축)
+    - 블록마다 최소/최대 시각을 기록해서 조회 시 블록을 건너뛸 수 있게 함
+    """
+
+    def __init__(self, path, block_rows=BLOCK_ROWS):
+        self.file = open(path, 'wb')
+        self.file.write(MAGIC)
+        self.block_rows = block_rows
+        self.events = {}
+        self.blocks = []
+        self._reset()
+
+    def _reset(self):
+        self.timestamps = []
+        self.event_codes = []
+        self.messages = []
+
+    def append(self, timestamp, event, message):
+        # timestamp 는 문자열 또는 이미 변환된 epoch 정수
+        self.timestamps.append(timestamp if isinstance(timestamp, int) else to_epoch(timestamp))
+        code = self.events.setdefault(event, len(self.events))
+        self.event_codes.append(code)
+        self.messages.append(message)
+        if len(self.timestamps) >= self.block_rows:
+            self._flush_block()
+
+    def _write_column(self, data):
+        offset = self.file.tell()
+        self.file.write(data)
+        return [offset, len(data)]
+
+    def _flush_block(self):
+        if not self.timestamps:
+            return
+        timestamps = self.timestamps
+        deltas = [timestamps[0]] + [b - a for a, b in zip(timestamps, timestamps[1:])]
+
+        dictionary = {}
+        message_codes = [dictionary.setdefault(m, len(dictionary)) for m in self.messages]
+        dictionary_bytes = zlib.compress('\n'.join(dictionary).encode('utf-8'))
+
+        self.blocks.append({
+            'rows': len(timestamps),
+            'min_ts': min(timestamps),
+            'max_ts': max(timestamps),
+            'timestamp': self._write_column(_pack(deltas, 'q')),
+            'event': self._write_column(_pack(self.event_codes, 'H')),
+            'message_dict': self._write_column(dictionary_bytes),
+            'message': self._write_column(_pack(message_codes, 'I'))
+        })
+        self._reset()
+
+    def close(self):
+        self._flush_block()
+        footer = json.dumps({
+            'events': sorted(self.events, key=self.events.get),
+            'blocks': self.blocks
+        }).encode('utf-8')
+        self.file.write(footer)
+        self.file.write(struct.pack('<Q', len(footer)))
+        self.file.close()
+
+
+class ArchiveReader:
+    def __init__(self, path):
+        self.file = open(path, 'rb')
+        if self.file.read(len(MAGIC)) != MAGIC:
+            self.file.close()
+            raise ValueError(f'열 단위 아카이브 파일이 아닙니다: {path}')
+        self.file.seek(-8, os.SEEK_END)
+        (footer_size,) = struct.unpack('<Q', self.file.read(8))
+        self.file.seek(-8 - footer_size, os.SEEK_END)
+        footer = json.loads(self.file.read(footer_size))
+        self.events = footer['events']
+        self.blocks = footer['blocks']
+
+    def _read_column(self, location):
+        offset, size = location
+        self.file.seek(offset)
+        return self.file.read(size)
+
+    def _timestamps(self, block):
+        deltas = _unpack(self._read_column(block['timestamp']), 'q')
+        timestamps = []
+        current = 0
+        for delta in deltas:
+            current += delta
+            timestamps.append(current)
+        return timestamps
+
+    def _blocks_in_range(self, start, end):
+        # 최소/최대 시각으로 겹치지 않는 블록은 건너뜀
+        for block in self.blocks:
+            if start is not None and block['max_ts'] < start:
+                continue
+            if end is not None and block['min_ts'] > end:
+                continue
+            yield block
+
+    def count_events(self, start=None, end=None):
+        """event 열만 읽어서 레벨별 개수를 센다 (블록이 범위에 완전히 들어가면 시각 열은 읽지 않음)"""
+        start = to_epoch(start) if start else None
+        end = to_epoch(end) if end else None
+        counts = Counter()
+        for block in self._blocks_in_range(start, end):
+            codes = _unpack(self._read_column(block['event']), 'H')
+            inside = (start is None or block['min_ts'] >= start) and (end is None or block['max_ts'] <= end)
+            if inside:
+                counts.update(codes)
+            else:
+                for ts, code in zip(self._timestamps(block), codes):
+                    if (start is None or ts >= start) and (end is None or ts <= end):
+                        counts[code] += 1
+        return {self.events[code]: count for code, count in counts.items()}
+
+    def iter_rows(self, start=None, end=None):
+        """(timestamp, event, message) 를 원래 순서대로 반환"""
+        start = to_epoch(start) if start else None
+        end = to_epoch(end) if end else None
+        for block in self._blocks_in_range(start, end):
+            timestamps = self._timestamps(block)
+            codes = _unpack(self._read_column(block['event']), 'H')
+            dictionary = zlib.decompress(self._read_column(block['message_dict'])).decode('utf-8').split('\n')
+            message_codes = _unpack(self._read_column(block['message']), 'I')
+            for ts, code, message_code in zip(timestamps, codes, message_codes):
+                if (start is None or ts >= start) and (end is None or ts <= end):
+                    yield from_epoch(ts), self.events[code], dictionary[message_code]
+
+    def close(self):
+        self.file.close()
+
+
+def convert(log_path, archive_path, block_rows=BLOCK_ROWS):
+    # 텍스트 로그 → 열 단위 아카이브
+    writer = ArchiveWriter(archive_path, block_rows)
+    rows = 0
+    try:
+        for epoch, event, message in iter_records(log_path):
+            writer.append(epoch, event.decode('utf-8'), message.decode('utf-8'))
+            rows += 1
+    finally:
+        writer.close()
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description='미션 로그 열 단위 아카이브')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    pack = sub.add_parser('convert', help='텍스트 로그를 아카이브로 변환')
+    pack.add_argument('log')
+    pack.add_argument('archive')
+
+    count = sub.add_parser('count', help='이벤트 레벨별 개수')
+    count.add_argument('archive')
+    count.add_argument('--start')
+    count.add_argument('--end')
+
+    dump = sub.add_parser('dump', help='아카이브 내용을 로그 형식으로 출력')
+    dump.add_argument('archive')
+    dump.add_argument('--start')
+    dump.add_argument('--end')
+
+    args = parser.parse_args()
+
+    try:
+        if args.command == 'convert':
+            rows = convert(args.log, args.archive)
+            before = os.path.getsize(args.log)
+            after = os.path.getsize(args.archive)
+            print(f'변환 완료: {rows}줄, {before} → {after} 바이트 ({before / max(after, 1):.1f}배)')
+            return
+
+        reader = ArchiveReader(args.archive)
+        try:
+            if args.command == 'count':
+                print(json.dumps(reader.count_events(args.start, args.end), indent=2, ensure_ascii=False))
+            else:
+                print(HEADER)
+                for row in reader.iter_rows(args.start, args.end):
+                    print(','.join(row))
+        finally:
+            reader.close()
+
+    except FileNotFoundError as e:
+        print(f'파일을 찾을 수 없습니다: {e.filename}')
+    except ValueError as e:
+        print(f'오류 발생: {e}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+import argparse
+import os
+import time
+from collections import Counter
+
+from fast_parser import decode_fields, split_line
+
+# 한 번에 읽을 최대 바이트 수 (큰 로그를 처음부터 따라가도 메모리는 이만큼만 사용)
+CHUNK_SIZE = 1024 * 1024
+
+
+class LogFollower:
+    """
+    tail -f 처럼 로그 파일을 따라가며 새로 추가된 바이트만 파싱한다.
+    - inode가 바뀌면 로테이션으로 보고 새 파일을 처음부터 읽음
+    - 새 내용은 CHUNK_SIZE 단위로 나눠 읽어서 메모리 사용량이 일정
+    - 파일 크기가 읽은 위치보다 작아지면 잘림(truncate)으로 보고 처음부터 읽음
+    - 이벤트 레벨별 개수를 누적해서 유지
+    """
+
+    def __init__(self, file_path, encoding='utf-8', from_start=True):
+        self.file_path = file_path
+        self.encoding = encoding
+        self.from_start = from_start
+        self.file = None
+        self.inode = None
+        self.position = 0
+        self.partial = b''
+        self.counters = Counter()
+        self.rotations = 0
+        self.truncations = 0
+
+    def _open(self, from_start):
+        if self.file:
+            self.file.close()
+        self.file = open(self.file_path, 'rb')
+        stat = os.fstat(self.file.fileno())
+        self.inode = stat.st_ino
+        self.position = 0 if from_start else stat.st_size
+        self.partial = b''
+        self.file.seek(self.position)
+
+    def _read_new(self):
+        # 현재 열린 파일에서 새로 추가된 완성된 줄을 CHUNK_SIZE 단위로 읽으며 하나씩 반환
+        while True:
+            chunk = self.file.read(CHUNK_SIZE)
+            if not chunk:
+                return
+            self.position += len(chunk)
+            lines = (self.partial + chunk).split(b'\n')
+            # 마지막 조각은 아직 개행이 안 들어온 줄
+            self.partial = lines.pop()
+            for line in lines:
+                yield line.rstrip(b'\r')
+
+    def _read_rotated(self):
+        # 로테이션된 파일에 남은 줄을 마저 읽고, 개행 없이 끝난 마지막 줄도 버리지 않음
+        yield from self._read_new()
+        if self.partial:
+            line = self.partial.rstrip(b'\r')
+            self.partial = b''
+            yield line
+
+    def iter_poll(self):
+        """새로 추가된 줄을 파싱해서 (timestamp, event, message) 를 하나씩 반환"""
+        try:
+            stat = os.stat(self.file_path)
+        except FileNotFoundError:
+            # 로테이션 도중 잠깐 파일이 없을 수 있음
+            return
+
+        if self.file is None:
+            self._open(self.from_start)
+        elif stat.st_ino != self.inode:
+            # 기존 파일에 남은 내용을 마저 읽고 새 파일로 전환
+            yield from self._parse(self._read_rotated())
+            self.rotations += 1
+            self._open(True)
+        elif stat.st_size < self.position:
+            self.truncations += 1
+            self._open(True)
+
+        yield from self._parse(self._read_new())
+
+    def _parse(self, lines):
+        for line in lines:
+            fields = split_line(line)
+            if fields is None:
+                continue
+            record = decode_fields(fields, self.encoding)
+            self.counters[record[1]] += 1
+            yield record
+
+    def poll(self):
+        """새로 추가된 줄을 파싱해서 (timestamp, event, message) 목록으로 반환"""
+        return list(self.iter_poll())
+
+    def follow(self, interval=1.0, on_record=None):
+        # interval 초마다 poll 해서 새 레코드를 on_record 로 넘긴다 (Ctrl+C 로 종료)
+        try:
+            while True:
+                for record in self.iter_poll():
+                    if on_record:
+                        on_record(record)
+                time.sleep(interval)
+        finally:
+            self.close()
+
+    def close(self):
+        if self.file:
+            self.file.close()
+            self.file = None
+
+
+def main():
+    parser = argparse.ArgumentParser(description='미션 로그 실시간 추적')
+    parser.add_argument('log')
+    parser.add_argument('--interval', type=float, default=1.0, help='확인 주기 (초)')
+    parser.add_argument('--from-end', action='store_true', help='기존 내용은 건너뛰고 새 줄만 출력')
+    args = parser.parse_args()
+
+    follower = LogFollower(args.log, from_start=not args.from_end)
+
+    def print_record(record):
+        timestamp, event, message = record
+        print(f'{timestamp} [{event}] {message}  (누적: {dict(follower.counters)})')
+
+    try:
+        follower.follow(args.interval, print_record)
+    except KeyboardInterrupt:
+        print(f'\n추적 종료. 이벤트 합계: {dict(follower.counters)}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,278 @@
+import argparse
+import bisect
+import json
+import os
+import struct
+
+from fast_parser import split_line
+
+# 몇 줄마다 타임스탬프 → 바이트 위치 체크포인트를 남길지
+CHECKPOINT_EVERY = 256
+
+INDEX_VERSION = 2
+
+# 체크포인트 레코드: 'YYYY-MM-DD HH:MM:SS' 19바이트 + 패딩 + uint64 바이트 위치 (32바이트)
+CHECKPOINT_FORMAT = '<19s5xQ'
+CHECKPOINT_SIZE = struct.calcsize(CHECKPOINT_FORMAT)
+
+
+def index_path_for(log_path):
+    # 로그 파일 옆에 만들어지는 사이드카 인덱스 경로 (작은 JSON 메타 정보)
+    return log_path + '.idx'
+
+
+def checkpoint_path_for(log_path):
+    # 체크포인트 바이너리 파일 (덧붙이기만 함)
+    return index_path_for(log_path) + '.ckpt'
+
+
+def posting_path_for(log_path, event_id):
+    # 이벤트 레벨 하나의 위치 목록 파일 (델타를 가변 길이 정수로 덧붙이기만 함)
+    return index_path_for(log_path) + f'.{event_id}.post'
+
+
+def _empty_index():
+    return {
+        'version': INDEX_VERSION,
+        'size': 0,            # 인덱싱이 끝난 바이트 위치 (완성된 줄까지만)
+        'lines': 0,           # 인덱싱된 로그 줄 수 (헤더 제외)
+        'checkpoints': 0,     # 체크포인트 파일의 레코드 수
+        # 이벤트 레벨별 {'id': 파일 번호, 'bytes': 파일 길이, 'last': 마지막 위치, 'count': 줄 수}
+        'events': {}
+    }
+
+
+def load_index(log_path):
+    # 메타 정보만 읽음 (체크포인트/위치 목록은 필요한 조회에서만 읽음)
+    path = index_path_for(log_path)
+    if not os.path.exists(path):
+        return _empty_index()
+    with open(path, 'r', encoding='utf-8') as f:
+        index = json.load(f)
+    # 예전 JSON 한 파일 형식이면 새로 만듦
+    if index.get('version') != INDEX_VERSION:
+        return _empty_index()
+    return index
+
+
+def save_index(log_path, index):
+    path = index_path_for(log_path)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, separators=(',', ':'), ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def _open_append(path, length):
+    # 메타 정보에 기록된 길이 뒤는 중간에 끊긴 갱신의 흔적이므로 잘라 내고 이어 씀
+    f = open(path, 'ab')
+    if f.tell() != length:
+        f.truncate(length)
+        f.seek(length)
+    return f
+
+
+def _encode_varint(value, out):
+    while value >= 0x80:
+        out.append((value & 0x7f) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def update_index(log_path):
+    """
+    인덱스를 갱신한다.
+    - 이전에 인덱싱한 위치 이후에 추가된 줄만 읽음 (추가된 줄이 없으면 아무것도 쓰지 않음)
+    - 새 체크포인트와 위치는 각 파일 끝에 덧붙이고 메타 정보만 다시 씀
+    - 파일이 줄어들었으면 (로테이션/잘림) 처음부터 다시 만듦
+    """
+    index = load_index(log_path)
+    file_size = os.path.getsize(log_path)
+    if file_size < index['size']:
+        index = _empty_index()
+    elif file_size == index['size']:
+        return index
+
+    new_checkpoints = bytearray()
+    new_postings = {}
+    events = index['events']
+    with open(log_path, 'rb') as f:
+        f.seek(index['size'])
+        offset = index['size']
+        for raw in f:
+            # 아직 쓰는 중인 마지막 줄은 다음 갱신 때 처리
+            if not raw.endswith(b'\n'):
+                break
+            line_offset = offset
+            offset += len(raw)
+
+            fields = split_line(raw.rstrip(b'\r\n'))
+            if fields is None:
+                continue
+            timestamp, event, _ = fields
+            event = event.decode('utf-8')
+
+            if index['lines'] % CHECKPOINT_EVERY == 0:
+                new_checkpoints += struct.pack(CHECKPOINT_FORMAT, timestamp, line_offset)
+            index['lines'] += 1
+
+            info = events.get(event)
+            if info is None:
+                info = events[event] = {'id': len(events), 'bytes': 0, 'last': 0, 'count': 0}
+            _encode_varint(line_offset - info['last'], new_postings.setdefault(event, bytearray()))
+            info['last'] = line_offset
+            info['count'] += 1
+
+    if offset == index['size'] and index['size']:
+        return index  # 완성된 줄이 새로 생기지 않음
+
+    with _open_append(checkpoint_path_for(log_path), index['checkpoints'] * CHECKPOINT_SIZE) as f:
+        f.write(new_checkpoints)
+    index['checkpoints'] += len(new_checkpoints) // CHECKPOINT_SIZE
+    for event, data in new_postings.items():
+        info = events[event]
+        with _open_append(posting_path_for(log_path, info['id']), info['bytes']) as f:
+            f.write(data)
+        info['bytes'] += len(data)
+
+    index['size'] = offset
+    save_index(log_path, index)
+    return index
+
+
+def load_checkpoints(log_path, index):
+    # [(타임스탬프 문자열, 바이트 위치), ...]
+    if not index['checkpoints']:
+        return []
+    with open(checkpoint_path_for(log_path), 'rb') as f:
+        data = f.read(index['checkpoints'] * CHECKPOINT_SIZE)
+    return [(timestamp.decode('ascii'), offset)
+            for timestamp, offset in struct.iter_unpack(CHECKPOINT_FORMAT, data)]
+
+
+def load_postings(log_path, info):
+    # 이벤트 레벨 하나의 델타 인코딩된 위치 목록 → 바이트 위치 목록
+    with open(posting_path_for(log_path, info['id']), 'rb') as f:
+        data = f.read(info['bytes'])
+    offsets = []
+    current = 0
+    value = 0
+    shift = 0
+    for byte in data:
+        value |= (byte & 0x7f) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        current += value
+        offsets.append(current)
+        value = 0
+        shift = 0
+    return offsets
+
+
+def _read_line_at(f, offset):
+    f.seek(offset)
+    return f.readline().rstrip(b'\r\n').decode('utf-8')
+
+
+def query_time_range(log_path, start=None, end=None):
+    """
+    start <= timestamp <= end 인 줄을 반환한다.
+    체크포인트를 이진 탐색해 시작 위치로 바로 이동한 뒤 end를 넘으면 멈춘다.
+    start/end 는 '2023-08-27 11:30' 처럼 앞부분만 줘도 된다.
+    """
+    index = update_index(log_path)
+    checkpoints = load_checkpoints(log_path, index)
+    timestamps = [cp[0] for cp in checkpoints]
+
+    start_offset = 0
+    if start and checkpoints:
+        pos = bisect.bisect_left(timestamps, start) - 1
+        if pos >= 0:
+            start_offset = checkpoints[pos][1]
+
+    results = []
+    with open(log_path, 'rb') as f:
+        f.seek(start_offset)
+        offset = start_offset
+        for raw in f:
+            if offset >= index['size']:
+                break
+            offset += len(raw)
+            line = raw.rstrip(b'\r\n')
+            fields = split_line(line)
+            if fields is None:
+                continue
+            timestamp = fields[0].decode('ascii')
+            if start and timestamp < start:
+                continue
+            if end and timestamp[:len(end)] > end:
+                break
+            results.append(line.decode('utf-8'))
+    return results
+
+
+def query_events(log_path, include=None, exclude=None):
+    """
+    이벤트 레벨로 줄을 찾는다. 파일 전체를 훑지 않고 해당 레벨의 위치만 읽는다.
+    - include: 포함할 레벨 목록
+    - exclude: 제외할 레벨 목록 (예: ['INFO'] → INFO가 아닌 모든 이벤트)
+    """
+    index = update_index(log_path)
+    offsets = []
+    for event, info in index['events'].items():
+        if include and event not in include:
+            continue
+        if exclude and event in exclude:
+            continue
+        offsets.extend(load_postings(log_path, info))
+    offsets.sort()
+
+    with open(log_path, 'rb') as f:
+        return [_read_line_at(f, offset) for offset in offsets]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='미션 로그 사이드카 인덱스')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    build = sub.add_parser('build', help='인덱스 생성/갱신')
+    build.add_argument('log')
+
+    query = sub.add_parser('query', help='인덱스를 이용한 조회')
+    query.add_argument('log')
+    query.add_argument('--start', help="시작 시각 (예: '2023-08-27 11:30')")
+    query.add_argument('--end', help="끝 시각 (예: '2023-08-27 11:45')")
+    query.add_argument('--level', action='append', help='포함할 이벤트 레벨')
+    query.add_argument('--exclude-level', action='append', help='제외할 이벤트 레벨')
+
+    args = parser.parse_args()
+
+    try:
+        if args.command == 'build':
+            index = update_index(args.log)
+            print(f"인덱스 갱신 완료: {index['lines']}줄, 체크포인트 {index['checkpoints']}개")
+            return
+
+        if args.level or args.exclude_level:
+            lines = query_events(args.log, args.level, args.exclude_level)
+            if args.start or args.end:
+                lines = [
+                    line for line in lines
+                    if (not args.start or line[:19] >= args.start)
+                    and (not args.end or line[:len(args.end)] <= args.end)
+                ]
+        else:
+            lines = query_time_range(args.log, args.start, args.end)
+
+        for line in lines:
+            print(line)
+
+    except FileNotFoundError:
+        print(f'파일을 찾을 수 없습니다: {args.log}')
+    except PermissionError:
+        print(f'파일에 접근할 권한이 없습니다: {args.log}')
+
+
+if __name__ == '__main__':
+    main()
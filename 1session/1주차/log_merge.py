@@ -0,0 +1,124 @@
+import heapq
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from fast_parser import decode_fields, split_line
+
+# 한 작업자가 맡는 바이트 구간 크기
+SHARD_SIZE = 4 * 1024 * 1024
+
+# 작업자 하나당 동시에 맡길 구간 수 (메모리 사용량 ≈ 작업자 수 x 2 x 구간)
+IN_FLIGHT_PER_WORKER = 2
+
+
+def find_log_files(directory, suffix='.log'):
+    # 디렉터리 안의 미션 로그 파일 목록 (이름순)
+    return sorted(
+        os.path.join(directory, name)
+        for name in os.listdir(directory)
+        if name.endswith(suffix) and os.path.isfile(os.path.join(directory, name))
+    )
+
+
+def split_shards(file_path, shard_size=SHARD_SIZE):
+    """
+    파일을 줄 경계에 맞춘 (시작, 끝) 바이트 구간으로 나눈다.
+    구간 끝을 다음 개행 직후로 밀어서 한 줄이 두 구간에 걸치지 않게 한다.
+    """
+    size = os.path.getsize(file_path)
+    shards = []
+    with open(file_path, 'rb') as f:
+        start = 0
+        while start < size:
+            end = min(start + shard_size, size)
+            if end < size:
+                f.seek(end)
+                f.readline()
+                end = f.tell()
+            shards.append((file_path, start, end))
+            start = end
+    return shards
+
+
+def parse_shard(shard, reverse=False):
+    # 작업자 프로세스: 구간 하나를 읽어 (timestamp, event, message) 목록으로 변환 (reverse 면 뒤 줄부터)
+    file_path, start, end = shard
+    with open(file_path, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+    records = [record for record in map(_parse_line, data.split(b'\n')) if record is not None]
+    if reverse:
+        records.reverse()
+    return records
+
+
+def _parse_line(raw):
+    fields = split_line(raw.rstrip(b'\r'))
+    return None if fields is None else decode_fields(fields)
+
+
+class _ShardScheduler:
+    """
+    여러 파일의 구간을 프로세스 풀에 나눠 맡기며 파일별 스트림으로 흘려보낸다.
+    동시에 풀에 올라가는 구간 수는 limit 개로 제한 (메모리 사용량 ≈ limit x 구간 크기).
+    남은 파일 수로 limit 를 나눠서 파일 하나만 있어도 모든 작업자가 일함.
+    """
+
+    def __init__(self, pool, shard_lists, limit, reverse):
+        self.pool = pool
+        self.limit = limit
+        self.reverse = reverse
+        self.queues = [deque(shards) for shards in shard_lists]
+        self.pending = [deque() for _ in shard_lists]
+        self.in_flight = 0
+
+    def _submit(self, index):
+        shard = self.queues[index].popleft()
+        self.pending[index].append(self.pool.submit(parse_shard, shard, self.reverse))
+        self.in_flight += 1
+
+    def _fill(self, first):
+        # 방금 소비한 파일부터 돌아가며 파일별 몫만큼 채움
+        count = len(self.queues)
+        active = sum(1 for index in range(count) if self.queues[index] or self.pending[index])
+        share = max(1, self.limit // max(active, 1))
+        for offset in range(count):
+            index = (first + offset) % count
+            while (self.queues[index] and self.in_flight < self.limit
+                   and len(self.pending[index]) < share):
+                self._submit(index)
+
+    def stream(self, index):
+        while True:
+            if not self.pending[index]:
+                if not self.queues[index]:
+                    return
+                # 몫이 안 돌아왔어도 병합이 기다리는 파일은 한 구간은 바로 맡김
+                self._submit(index)
+            future = self.pending[index].popleft()
+            self.in_flight -= 1
+            self._fill(index)
+            yield from future.result()
+
+
+def merge_directory(directory, workers=None, shard_size=SHARD_SIZE, reverse=False):
+    """
+    디렉터리의 모든 로그를 프로세스 풀로 나눠 파싱하고
+    힙 기반 k-way 병합으로 전체 시간순 스트림을 만든다. (reverse 면 가장 최근 줄부터)
+    파일마다 구간을 순서대로 흘려보내므로 파일 전체를 메모리에 올리지 않는다.
+    (각 파일은 자체적으로 시간순이라고 가정)
+    """
+    files = find_log_files(directory)
+    workers = workers or os.cpu_count() or 1
+    shard_lists = []
+    for file_path in files:
+        shards = split_shards(file_path, shard_size)
+        if reverse:
+            shards.reverse()
+        shard_lists.append(shards)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # 작업자가 쉬지 않도록 작업자 수의 두 배까지 미리 맡김
+        scheduler = _ShardScheduler(pool, shard_lists, workers * IN_FLIGHT_PER_WORKER, reverse)
+        streams = [scheduler.stream(index) for index in range(len(files))]
+        yield from heapq.merge(*streams, key=lambda record: record[0], reverse=reverse)
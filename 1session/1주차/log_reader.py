@@ -0,0 +1,63 @@
+import os
+
+# 한 번에 읽어 들일 블록 크기 (바이트)
+BLOCK_SIZE = 64 * 1024
+
+
+class ReverseLogReader:
+    """
+    로그 파일을 뒤에서부터 고정 크기 블록 단위로 읽는 리더.
+    - 파일 전체를 메모리에 올리지 않음 (블록 + 걸쳐 있는 한 줄만 유지)
+    - 읽는 양은 요청한 줄 수에 비례하고 파일 크기와는 무관
+    """
+
+    def __init__(self, file_path, encoding='utf-8', block_size=BLOCK_SIZE):
+        self.file_path = file_path
+        self.encoding = encoding
+        self.block_size = block_size
+
+    def iter_reversed_bytes(self):
+        # 마지막 줄부터 한 줄씩 (개행 제외 bytes) 반환
+        with open(self.file_path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            pos = f.tell()
+            remainder = b''
+            first_block = True
+
+            while pos > 0:
+                read_size = min(self.block_size, pos)
+                pos -= read_size
+                f.seek(pos)
+                block = f.read(read_size) + remainder
+
+                # 파일 끝의 개행은 빈 줄로 취급하지 않음
+                if first_block:
+                    first_block = False
+                    if block.endswith(b'\n'):
+                        block = block[:-1]
+
+                parts = block.split(b'\n')
+                # 맨 앞 조각은 이전 블록과 이어질 수 있으니 남겨 둠
+                remainder = parts[0]
+                for part in reversed(parts[1:]):
+                    yield part.rstrip(b'\r')
+
+            if remainder or not first_block:
+                yield remainder.rstrip(b'\r')
+
+    def iter_reversed(self):
+        # 마지막 줄부터 한 줄씩 (문자열) 반환
+        for raw in self.iter_reversed_bytes():
+            yield raw.decode(self.encoding)
+
+    def tail(self, n):
+        # 마지막 n줄을 원래 순서대로 반환
+        lines = []
+        if n <= 0:
+            return lines
+        for line in self.iter_reversed():
+            lines.append(line)
+            if len(lines) >= n:
+                break
+        lines.reverse()
+        return lines
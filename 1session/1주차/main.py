@@ -1,38 +1,57 @@
-print('Hello Mars')
+import os
+import sys
 
-#파일 경로
+from log_reader import ReverseLogReader
+from log_merge import merge_directory
+
+#파일 경로 (인자로 파일 또는 디렉터리를 넘길 수 있음)
 file_path = 'D:/study/codysseycode/1주차/mission_computer_main.log'
 
 output_file = "last_3_lines.log"
 
-try:
- # 파일열어서 한줄씩 읽기
- with open(file_path, 'r', encoding='utf-8') as f:
-  lines = f.readlines()
-
-  # 리스트 정상 출력
-  #for line in lines:
-   #print(line.strip())
-
-  last_lines = lines[-3:]  # 마지막 3줄 추출
-
-  # 리스트를 거꾸로 뒤집어 출력
-  for line in reversed(lines):  
-   print(line.strip())
-
- # 새로운 파일 생성 및 저장
- with open(output_file, "w", encoding="utf-8") as f:
-  f.writelines(last_lines)
-
-#파일 찾을수 없을때
-except FileNotFoundError:
- print(f"파일을 찾을 수 없습니다: {file_path}")
-# 권한 없을떄
-except PermissionError:
- print(f"파일에 접근할 권한이 없습니다: {file_path}")
-#인코딩 문제
-except UnicodeDecodeError:
- print(f"파일 인코딩 문제 발생. 다른 인코딩을 시도해 보세요: {file_path}")
-#이외 오류
-except Exception as e:
- print(f"오류 발생: {e}")
+
+def main(file_path):
+ print('Hello Mars')
+
+ try:
+  if os.path.isdir(file_path):
+   # 디렉터리 모드: 뒤쪽 구간부터 프로세스 풀로 파싱하며 최근 줄부터 병합 (전체를 메모리에 올리지 않음)
+   last_lines = []
+   for record in merge_directory(file_path, reverse=True):
+    line = ','.join(record)
+    if len(last_lines) < 3:  # 마지막 3줄 추출 (역순으로 앞 3줄)
+     last_lines.append(line)
+    print(line)
+   last_lines.reverse()
+  else:
+   # 파일 전체를 읽지 않고 뒤에서부터 블록 단위로 읽기 (대용량 로그 대응)
+   reader = ReverseLogReader(file_path)
+
+   last_lines = reader.tail(3)  # 마지막 3줄 추출
+
+   # 로그를 거꾸로 출력
+   for line in reader.iter_reversed():
+    print(line.strip())
+
+  # 새로운 파일 생성 및 저장
+  with open(output_file, "w", encoding="utf-8") as f:
+   for line in last_lines:
+    f.write(line + "\n")
+
+ #파일 찾을수 없을때
+ except FileNotFoundError:
+  print(f"파일을 찾을 수 없습니다: {file_path}")
+ # 권한 없을떄
+ except PermissionError:
+  print(f"파일에 접근할 권한이 없습니다: {file_path}")
+ #인코딩 문제
+ except UnicodeDecodeError:
+  print(f"파일 인코딩 문제 발생. 다른 인코딩을 시도해 보세요: {file_path}")
+ #이외 오류
+ except Exception as e:
+  print(f"오류 발생: {e}")
+
+
+# 다른 모듈에서 import 할 때는 실행하지 않음
+if __name__ == '__main__':
+ main(sys.argv[1] if len(sys.argv) > 1 else file_path)
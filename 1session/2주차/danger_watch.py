@@ -0,0 +1,179 @@
+import argparse
+import csv
+import math
+import os
+import random
+import time
+
+from inventory_columns import to_float
+from inventory_binary import InventoryBinaryWriter
+
+MAX_LEVEL = 32
+
+
+class _Node:
+    __slots__ = ('key', 'row', 'forward')
+
+    def __init__(self, key, row, level):
+        self.key = key
+        self.row = row
+        self.forward = [None] * level
+
+
+class SkipList:
+    """
+    키 순서로 정렬된 상태를 유지하는 스킵 리스트.
+    - 삽입: 평균 O(log n) (리스트 insort 처럼 뒤쪽 원소를 밀지 않음)
+    - 순회: 앞에서부터 키 순서대로
+    """
+
+    def __init__(self):
+        self.head = _Node(None, None, MAX_LEVEL)
+        self.level = 1
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def _random_level(self):
+        level = 1
+        while level < MAX_LEVEL and random.random() < 0.5:
+            level += 1
+        return level
+
+    def insert(self, key, row):
+        update = [self.head] * MAX_LEVEL
+        node = self.head
+        for i in range(self.level - 1, -1, -1):
+            while node.forward[i] is not None and node.forward[i].key < key:
+                node = node.forward[i]
+            update[i] = node
+
+        level = self._random_level()
+        if level > self.level:
+            self.level = level
+        new_node = _Node(key, row, level)
+        for i in range(level):
+            new_node.forward[i] = update[i].forward[i]
+            update[i].forward[i] = new_node
+        self.size += 1
+
+    def __iter__(self):
+        node = self.head.forward[0]
+        while node is not None:
+            yield node.key, node.row
+            node = node.forward[0]
+
+
+class DangerWatcher:
+    """
+    인벤토리 CSV에 추가되는 행만 읽어서 인화성 정렬 구조에 넣고,
+    위험 물질(threshold 초과) 목록이 바뀔 때만 결과 파일을 다시 쓴다.
+    """
+
+    def __init__(self, input_path, danger_path, bin_path=None, threshold=0.7):
+        self.input_path = input_path
+        self.danger_path = danger_path
+        self.bin_path = bin_path
+        self.threshold = threshold
+        self._reset()
+
+    def _reset(self):
+        self.rows = SkipList()
+        self.position = 0
+        self.partial = b''
+        self.header_seen = False
+        self.sequence = 0
+        self.danger_count = 0
+        self.rewrites = 0
+
+    def add_row(self, row):
+        # 새 행 하나를 넣고 위험 목록이 바뀌었는지 반환
+        flam = to_float(row[-1])
+        if math.isnan(flam):
+            return False
+        # 인화성 내림차순, 같은 값은 들어온 순서대로
+        self.rows.insert((-flam, self.sequence), row)
+        self.sequence += 1
+        if flam > self.threshold:
+            self.danger_count += 1
+            return True
+        return False
+
+    def poll(self):
+        """새로 추가된 행을 반영하고, 위험 목록이 바뀌었으면 결과 파일을 다시 쓴다."""
+        size = os.path.getsize(self.input_path)
+        changed = False
+        if size < self.position:
+            # 파일이 잘렸으면 처음부터 다시
+            self._reset()
+            changed = True
+
+        with open(self.input_path, 'rb') as f:
+            f.seek(self.position)
+            chunk = f.read()
+        self.position += len(chunk)
+
+        lines = (self.partial + chunk).split(b'\n')
+        self.partial = lines.pop()
+        text_lines = [line.decode('utf-8').rstrip('\r') for line in lines if line.strip()]
+        if not self.header_seen and text_lines:
+            text_lines = text_lines[1:]
+            self.header_seen = True
+
+        for row in csv.reader(text_lines):
+            if row and self.add_row(row):
+                changed = True
+
+        if changed:
+            self.write_outputs()
+        return changed
+
+    def danger_rows(self):
+        for key, row in self.rows:
+            if -key[0] <= self.threshold:
+                break
+            yield row
+
+    def write_outputs(self):
+        # 임시 파일에 쓴 뒤 교체해서 읽는 쪽이 반쯤 쓴 파일을 보지 않게 함
+        tmp_path = self.danger_path + '.tmp'
+        binary = InventoryBinaryWriter(self.bin_path + '.tmp') if self.bin_path else None
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            for row in self.danger_rows():
+                file.write(','.join(row) + '\n')
+                if binary:
+                    binary.write(row[0], to_float(row[1]), to_float(row[2]), row[3], to_float(row[-1]))
+        os.replace(tmp_path, self.danger_path)
+        if binary:
+            binary.close()
+            os.replace(self.bin_path + '.tmp', self.bin_path)
+        self.rewrites += 1
+
+    def watch(self, interval=1.0):
+        while True:
+            if self.poll():
+                print(f'위험 물질 목록 갱신: {self.danger_count}건 (전체 {len(self.rows)}건)')
+            time.sleep(interval)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='인벤토리 추가분을 반영하는 위험 물질 목록 유지')
+    parser.add_argument('input', help='인벤토리 CSV')
+    parser.add_argument('--danger', default='Mars_Base_Inventory_danger.csv')
+    parser.add_argument('--bin', help='위험 물질 바이너리 저장 경로')
+    parser.add_argument('--threshold', type=float, default=0.7)
+    parser.add_argument('--interval', type=float, default=1.0, help='확인 주기 (초)')
+    args = parser.parse_args()
+
+    watcher = DangerWatcher(args.input, args.danger, args.bin, args.threshold)
+    try:
+        watcher.watch(args.interval)
+    except KeyboardInterrupt:
+        print(f'\n감시 종료. 결과 파일 갱신 {watcher.rewrites}회')
+    except FileNotFoundError as e:
+        print(f'파일을 찾을 수 없습니다: {e.filename}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,155 @@
+import argparse
+import csv
+import heapq
+import math
+import os
+import sys
+import tempfile
+
+from inventory_columns import CSV_ENCODING, to_float
+from inventory_binary import InventoryBinaryWriter
+
+# 기본 메모리 예산 (MB)
+DEFAULT_MEMORY_MB = 64
+
+# 한 번에 병합할 최대 런(run) 파일 수
+MAX_FAN_IN = 64
+
+# 행 하나를 메모리에 둘 때 드는 대략적인 고정 비용 (리스트 + 키 튜플)
+ROW_OVERHEAD = 200
+
+# 바이너리도 저장할 때 메모리 예산 중 문자열 테이블에 떼어 줄 비율
+BINARY_SHARE = 0.25
+
+
+def sort_key(row):
+    # 인화성 내림차순, NaN(예: 'Various') 은 맨 뒤
+    flam = to_float(row[-1])
+    return math.inf if math.isnan(flam) else -flam
+
+
+def _write_run(rows, temp_dir):
+    rows.sort(key=sort_key)  # 정렬은 안정적이라 같은 값은 원래 순서 유지
+    fd, path = tempfile.mkstemp(suffix='.run', dir=temp_dir)
+    with os.fdopen(fd, 'w', encoding='utf-8', newline='') as file:
+        csv.writer(file).writerows(rows)
+    return path
+
+
+def _read_run(path):
+    with open(path, 'r', encoding='utf-8', newline='') as file:
+        yield from csv.reader(file)
+
+
+def _merge_runs(paths, temp_dir):
+    # 파일 핸들 수를 넘지 않도록 MAX_FAN_IN 개씩 여러 단계로 병합
+    while len(paths) > MAX_FAN_IN:
+        merged = []
+        for start in range(0, len(paths), MAX_FAN_IN):
+            group = paths[start:start + MAX_FAN_IN]
+            fd, path = tempfile.mkstemp(suffix='.run', dir=temp_dir)
+            with os.fdopen(fd, 'w', encoding='utf-8', newline='') as file:
+                csv.writer(file).writerows(heapq.merge(*map(_read_run, group), key=sort_key))
+            for old in group:
+                os.remove(old)
+            merged.append(path)
+        paths = merged
+    return paths
+
+
+def external_sort(rows, memory_mb=DEFAULT_MEMORY_MB, temp_dir=None):
+    """
+    행들을 인화성 내림차순으로 정렬해서 하나씩 돌려준다.
+    - 메모리 예산만큼 모이면 정렬해서 임시 파일(런)로 내보냄
+    - 런들을 힙 기반 k-way 병합으로 읽으면서 바로 돌려줌
+    전체 데이터를 한꺼번에 메모리에 올리지 않는다.
+    """
+    budget = memory_mb * 1024 * 1024
+    runs = []
+    buffer = []
+    used = 0
+    try:
+        for row in rows:
+            buffer.append(row)
+            used += ROW_OVERHEAD + sum(sys.getsizeof(field) for field in row)
+            if used >= budget:
+                runs.append(_write_run(buffer, temp_dir))
+                buffer = []
+                used = 0
+
+        if not runs:
+            # 예산 안에 다 들어가면 파일로 내보낼 필요 없음
+            buffer.sort(key=sort_key)
+            yield from buffer
+            return
+        if buffer:
+            runs.append(_write_run(buffer, temp_dir))
+            buffer = []
+
+        runs = _merge_runs(runs, temp_dir)
+        yield from heapq.merge(*map(_read_run, runs), key=sort_key)
+    finally:
+        for path in runs:
+            if os.path.exists(path):
+                os.remove(path)
+
+
+def write_danger(input_path, danger_path, bin_path=None, threshold=0.7,
+                 memory_mb=DEFAULT_MEMORY_MB, sorted_path=None):
+    """
+    정렬 결과를 받아서 위험 물질 CSV / 바이너리로 바로 흘려 쓴다.
+    sorted_path 가 없으면 인화성이 threshold 이하로 내려가는 순간 병합을 멈춘다.
+    bin_path 가 있으면 memory_mb 를 정렬과 바이너리 문자열 테이블이 나눠 쓴다.
+    """
+    count = 0
+    sort_mb = memory_mb * (1 - BINARY_SHARE) if bin_path else memory_mb
+    with open(input_path, 'r', encoding=CSV_ENCODING, newline='') as source, \
+            open(danger_path, 'w', encoding='utf-8') as danger_file:
+        csv_reader = csv.reader(source)
+        header = next(csv_reader)
+        sorted_file = open(sorted_path, 'w', encoding='utf-8') if sorted_path else None
+        binary = InventoryBinaryWriter(bin_path, memory_mb * BINARY_SHARE) if bin_path else None
+        try:
+            if sorted_file:
+                sorted_file.write(','.join(header) + '\n')
+            for row in external_sort((row for row in csv_reader if row), sort_mb):
+                flam = to_float(row[-1])
+                is_danger = flam > threshold
+                if sorted_file:
+                    sorted_file.write(','.join(row) + '\n')
+                elif not is_danger:
+                    break
+                if is_danger:
+                    danger_file.write(','.join(row) + '\n')
+                    if binary:
+                        binary.write(row[0], to_float(row[1]), to_float(row[2]), row[3], flam)
+                    count += 1
+        finally:
+            if sorted_file:
+                sorted_file.close()
+            if binary:
+                binary.close()
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description='메모리보다 큰 인벤토리 파일의 외부 정렬')
+    parser.add_argument('input', help='인벤토리 CSV')
+    parser.add_argument('--danger', default='Mars_Base_Inventory_danger.csv', help='위험 물질 CSV 저장 경로')
+    parser.add_argument('--bin', help='위험 물질 바이너리 저장 경로')
+    parser.add_argument('--sorted', help='전체 정렬 결과 CSV 저장 경로')
+    parser.add_argument('--threshold', type=float, default=0.7)
+    parser.add_argument('--memory-mb', type=int, default=DEFAULT_MEMORY_MB, help='정렬에 쓸 메모리 예산 (MB)')
+    args = parser.parse_args()
+
+    try:
+        count = write_danger(args.input, args.danger, args.bin, args.threshold, args.memory_mb, args.sorted)
+        print(f'위험 물질 {count}건 저장 완료: {args.danger}')
+    except FileNotFoundError as e:
+        print(f'파일을 찾을 수 없습니다: {e.filename}')
+    except PermissionError as e:
+        print(f'파일에 접근할 권한이 없습니다: {e.filename}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,220 @@
+import mmap
+import shutil
+import struct
+import sys
+import tempfile
+
+import numpy as np
+
+from inventory_columns import format_value
+
+MAGIC = b'MBINV001'
+VERSION = 1
+
+# 헤더: 매직, 버전, 레코드 크기, 레코드 수, 문자열 테이블 위치, 문자열 테이블 크기
+HEADER_FORMAT = '<8sIIQQQ'
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+
+# 레코드: 물질명(문자열 번호), 무게, 비중, 강도(문자열 번호), 인화성 → 32바이트 고정 폭
+RECORD_FORMAT = '<IddId'
+RECORD_SIZE = struct.calcsize(RECORD_FORMAT)
+RECORD_DTYPE = np.dtype([
+    ('substance', '<u4'),
+    ('weight', '<f8'),
+    ('specific_gravity', '<f8'),
+    ('strength', '<u4'),
+    ('flammability', '<f8')
+])
+
+# 레코드 필드 ↔ CSV 열 이름
+FIELDS = (
+    ('substance', 'Substance'),
+    ('weight', 'Weight (g/cm³)'),
+    ('specific_gravity', 'Specific Gravity'),
+    ('strength', 'Strength'),
+    ('flammability', 'Flammability')
+)
+STRING_FIELDS = ('substance', 'strength')
+
+# 메모리 예산이 없을 때 문자열 테이블 임시 파일을 메모리에 둘 최대 크기
+SPOOL_SIZE = 8 * 1024 * 1024
+
+# 중복 제거 사전 항목 하나의 대략적인 고정 비용 (문자열 객체 크기 제외)
+ENTRY_OVERHEAD = 100
+
+
+class StringTable:
+    """
+    같은 문자열은 한 번만 저장하고 번호로 참조.
+    문자열 본문과 끝 위치는 추가하는 즉시 임시 파일로 흘려 쓰고(작으면 메모리, 크면 디스크)
+    메모리에는 중복 제거용 사전만 둔다.
+    memory_bytes 를 주면 사전이 예산을 넘을 때마다 비움 (이후 같은 문자열이 한 번 더 저장될 수 있음)
+    """
+
+    def __init__(self, memory_bytes=None):
+        self.memory_bytes = memory_bytes
+        spool_size = SPOOL_SIZE if memory_bytes is None else max(memory_bytes // 4, 1)
+        self.data = tempfile.SpooledTemporaryFile(max_size=spool_size)
+        self.offsets = tempfile.SpooledTemporaryFile(max_size=spool_size)
+        self.offsets.write(struct.pack('<I', 0))
+        self.ids = {}
+        self.ids_size = 0
+        self.count = 0
+        self.size = 0
+
+    def add(self, text):
+        string_id = self.ids.get(text)
+        if string_id is not None:
+            return string_id
+        encoded = text.encode('utf-8')
+        self.data.write(encoded)
+        self.size += len(encoded)
+        self.offsets.write(struct.pack('<I', self.size))
+        string_id = self.count
+        self.count += 1
+
+        if self.memory_bytes is not None and self.ids_size >= self.memory_bytes // 2:
+            self.ids.clear()
+            self.ids_size = 0
+        self.ids[text] = string_id
+        self.ids_size += ENTRY_OVERHEAD + sys.getsizeof(text)
+        return string_id
+
+    def write_to(self, file):
+        # [문자열 수][끝 위치 (수 + 1)개][본문] 형식으로 기록하고 기록한 바이트 수를 반환
+        file.write(struct.pack('<I', self.count))
+        for spool in (self.offsets, self.data):
+            spool.seek(0)
+            shutil.copyfileobj(spool, file)
+        return 4 + (self.count + 1) * 4 + self.size
+
+    def close(self):
+        self.data.close()
+        self.offsets.close()
+
+
+class InventoryBinaryWriter:
+    """
+    레코드를 한 줄씩 받아 바로 파일에 쓴다. (전체 데이터를 메모리에 두지 않음)
+    문자열 테이블과 헤더는 close() 때 기록한다.
+    memory_mb: 문자열 테이블에 쓸 메모리 예산 (None 이면 제한 없이 중복 제거)
+    """
+
+    def __init__(self, path, memory_mb=None):
+        self.file = open(path, 'wb')
+        self.file.write(b'\0' * HEADER_SIZE)
+        self.strings = StringTable(None if memory_mb is None else int(memory_mb * 1024 * 1024))
+        # 열 이름을 문자열 테이블 맨 앞에 넣어 둠
+        for _, name in FIELDS:
+            self.strings.add(name)
+        self.count = 0
+
+    def write(self, substance, weight, gravity, strength, flammability):
+        self.file.write(struct.pack(
+            RECORD_FORMAT,
+            self.strings.add(substance), weight, gravity, self.strings.add(strength), flammability
+        ))
+        self.count += 1
+
+    def close(self):
+        strings_offset = self.file.tell()
+        table_size = self.strings.write_to(self.file)
+        self.strings.close()
+
+        self.file.seek(0)
+        self.file.write(struct.pack(
+            HEADER_FORMAT, MAGIC, VERSION, RECORD_SIZE, self.count, strings_offset, table_size
+        ))
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def write_inventory(path, inventory, indices=None):
+    """
+    인벤토리를 고정 폭 바이너리 레코드로 저장한다.
+    indices 를 주면 그 행들만 그 순서대로 저장한다. (예: 위험 물질 목록)
+    """
+    if indices is None:
+        indices = range(len(inventory))
+    names = [name for _, name in FIELDS]
+    with InventoryBinaryWriter(path) as writer:
+        for index in indices:
+            writer.write(*(inventory.value(name, index) for name in names))
+    return writer.count
+
+
+class InventoryBinaryReader:
+    """
+    메모리 맵으로 바이너리 인벤토리를 연다.
+    - 파일을 통째로 읽거나 파싱하지 않으므로 여는 시간이 파일 크기와 무관
+    - record(i): i번째 레코드를 O(1) 로 읽음
+    - column(name): 복사 없는 numpy 열 뷰
+    """
+
+    def __init__(self, path):
+        self.file = open(path, 'rb')
+        self.mm = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, record_size, count, strings_offset, _ = struct.unpack_from(HEADER_FORMAT, self.mm, 0)
+        if magic != MAGIC or record_size != RECORD_SIZE:
+            self.close()
+            raise ValueError(f'인벤토리 바이너리 파일이 아닙니다: {path}')
+        self.version = version
+        self.count = count
+        self.records = np.frombuffer(self.mm, dtype=RECORD_DTYPE, count=count, offset=HEADER_SIZE)
+
+        (string_count,) = struct.unpack_from('<I', self.mm, strings_offset)
+        self._string_offsets = np.frombuffer(self.mm, dtype='<u4', count=string_count + 1, offset=strings_offset + 4)
+        self._string_base = strings_offset + 4 + (string_count + 1) * 4
+        self._string_cache = {}
+        self.header = [self.string(i) for i in range(len(FIELDS))]
+
+    def __len__(self):
+        return self.count
+
+    def string(self, string_id):
+        text = self._string_cache.get(string_id)
+        if text is None:
+            start = self._string_base + int(self._string_offsets[string_id])
+            end = self._string_base + int(self._string_offsets[string_id + 1])
+            text = self.mm[start:end].decode('utf-8')
+            self._string_cache[string_id] = text
+        return text
+
+    def column(self, field):
+        # 복사 없는 열 뷰 (문자열 열은 문자열 번호)
+        return self.records[field]
+
+    def record(self, index):
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        values = list(struct.unpack_from(RECORD_FORMAT, self.mm, HEADER_SIZE + index * RECORD_SIZE))
+        for position, (field, _) in enumerate(FIELDS):
+            if field in STRING_FIELDS:
+                values[position] = self.string(values[position])
+        return values
+
+    def __iter__(self):
+        for index in range(self.count):
+            yield self.record(index)
+
+    def close(self):
+        # numpy 뷰가 mmap 을 붙잡고 있으면 닫을 수 없으므로 먼저 해제
+        self.records = None
+        self._string_offsets = None
+        self.mm.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def format_record(record):
+    return [format_value(value) for value in record]
@@ -0,0 +1,144 @@
+import csv
+import math
+
+import numpy as np
+
+# 숫자로 다룰 열과 문자열로 다룰 열
+NUMERIC_COLUMNS = ('Weight (g/cm³)', 'Specific Gravity', 'Flammability')
+FLAMMABILITY = 'Flammability'
+
+# 숫자 대신 들어 있는 값 (예: 'Various') 은 NaN 으로 표시
+MISSING_TEXT = 'Various'
+
+# 입력 CSV 인코딩 (엑셀 등이 붙이는 BOM 은 첫 열 이름에 섞이지 않게 제거)
+CSV_ENCODING = 'utf-8-sig'
+
+
+def to_float(text):
+    try:
+        return float(text)
+    except ValueError:
+        return math.nan
+
+
+def format_value(value):
+    # 저장할 때 NaN 은 원래 표기('Various')로 되돌림
+    if isinstance(value, float) and math.isnan(value):
+        return MISSING_TEXT
+    return str(value)
+
+
+class StringColumn:
+    """
+    문자열 열을 UTF-8 바이트 한 덩어리 + 시작 위치 배열로 보관한다.
+    i 번째 값은 data[offsets[i]:offsets[i + 1]] (고정 폭 문자열 배열처럼 가장 긴 값에 맞춰 낭비하지 않음)
+    """
+    __slots__ = ('data', 'offsets')
+
+    def __init__(self, data, offsets):
+        self.data = data
+        self.offsets = offsets
+
+    @classmethod
+    def from_strings(cls, values):
+        encoded = [value.encode('utf-8') for value in values]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(value) for value in encoded], out=offsets[1:])
+        return cls(b''.join(encoded), offsets)
+
+    @classmethod
+    def concat(cls, parts):
+        # 여러 구간의 열을 순서대로 이어 붙임 (위치는 앞 구간 길이만큼 밀어 줌)
+        offsets = [np.zeros(1, dtype=np.int64)]
+        shift = 0
+        for part in parts:
+            offsets.append(part.offsets[1:] + shift)
+            shift += len(part.data)
+        return cls(b''.join(part.data for part in parts), np.concatenate(offsets))
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        return self.data[self.offsets[index]:self.offsets[index + 1]].decode('utf-8')
+
+    @property
+    def nbytes(self):
+        return len(self.data) + self.offsets.nbytes
+
+
+class Inventory:
+    """
+    인벤토리 CSV를 열(column) 단위 배열로 보관한다.
+    - 숫자 열: float64 배열 (숫자가 아니면 NaN)
+    - 문자열 열: StringColumn (UTF-8 바이트 + 시작 위치)
+    행마다 리스트를 만들지 않고 배열 연산으로 정렬/필터링한다.
+    """
+
+    def __init__(self, header, columns):
+        self.header = header
+        self.columns = columns
+
+    def __len__(self):
+        return len(self.columns[self.header[0]])
+
+    @property
+    def flammability(self):
+        return self.columns[FLAMMABILITY]
+
+    def value(self, name, index):
+        column = self.columns[name]
+        if isinstance(column, StringColumn):
+            return column[index]
+        return column[index].item()
+
+    def row(self, index):
+        return [self.value(name, index) for name in self.header]
+
+    def rows(self, indices):
+        for index in indices:
+            yield self.row(index)
+
+    def sorted_by_flammability(self):
+        # 인화성 내림차순 인덱스 (같은 값은 원래 순서 유지, NaN 은 맨 뒤)
+        flam = self.flammability
+        keys = np.where(np.isnan(flam), np.inf, -flam)
+        return np.argsort(keys, kind='stable')
+
+    def danger_indices(self, threshold=0.7, order=None):
+        # threshold 를 넘는 행의 인덱스 (order 가 있으면 그 순서 유지)
+        if order is None:
+            order = self.sorted_by_flammability()
+        return order[self.flammability[order] > threshold]
+
+
+def build_inventory(header, values):
+    # 열 이름 순서대로 모은 값 목록 → 열 배열
+    columns = {}
+    for name, column in zip(header, values):
+        if name in NUMERIC_COLUMNS:
+            columns[name] = np.array(column, dtype=np.float64)
+        else:
+            columns[name] = StringColumn.from_strings(column)
+    return Inventory(header, columns)
+
+
+def load_inventory(file_path):
+    # 행 리스트를 쌓지 않고 읽으면서 바로 열별로 나눠 담음
+    with open(file_path, 'r', encoding=CSV_ENCODING) as file:
+        csv_reader = csv.reader(file)
+        header = next(csv_reader)
+        numeric = [name in NUMERIC_COLUMNS for name in header]
+        values = [[] for _ in header]
+        for row in csv_reader:
+            if not row:
+                continue
+            for position, text in enumerate(row):
+                values[position].append(to_float(text) if numeric[position] else text)
+    return build_inventory(header, values)
+
+
+def write_rows(path, inventory, indices):
+    with open(path, 'w', encoding='utf-8') as file:
+        for row in inventory.rows(indices):
+            file.write(','.join(map(format_value, row)) + '\n')
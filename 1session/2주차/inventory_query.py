@@ -0,0 +1,51 @@
+import heapq
+
+import numpy as np
+
+
+def top_k(inventory, n):
+    """
+    인화성이 가장 높은 n개 행의 인덱스 (내림차순, 같은 값은 원래 순서).
+    전체를 정렬하지 않고 크기 n 의 힙만 유지한다. (O(N log n))
+    """
+    flam = inventory.flammability
+    valid = np.flatnonzero(~np.isnan(flam)).tolist()
+    return heapq.nlargest(n, valid, key=flam.item)
+
+
+class FlammabilityIndex:
+    """
+    인화성 값을 한 번만 정렬해 두고 여러 번의 범위 조회를 이진 탐색으로 처리한다.
+    - 생성: O(N log N) 한 번
+    - 조회: O(log N + 결과 수)
+    NaN('Various') 인 행은 색인에 넣지 않는다.
+    """
+
+    def __init__(self, inventory):
+        flam = inventory.flammability
+        valid = np.flatnonzero(~np.isnan(flam))
+        # 값 오름차순, 같은 값은 뒤쪽 행이 먼저 → 뒤집으면 내림차순 + 원래 순서
+        order = np.lexsort((-valid, flam[valid]))
+        self.positions = valid[order]
+        self.values = flam[self.positions]
+
+    def __len__(self):
+        return len(self.values)
+
+    def range(self, lo, hi):
+        # lo <= 인화성 <= hi 인 행 인덱스 (인화성 내림차순)
+        start = np.searchsorted(self.values, lo, side='left')
+        end = np.searchsorted(self.values, hi, side='right')
+        return self.positions[start:end][::-1]
+
+    def above(self, threshold):
+        # 인화성 > threshold 인 행 인덱스 (인화성 내림차순)
+        start = np.searchsorted(self.values, threshold, side='right')
+        return self.positions[start:][::-1]
+
+    def descending(self):
+        # 전체 행을 인화성 내림차순으로
+        return self.positions[::-1]
+
+    def top_k(self, n):
+        return self.positions[::-1][:n]
@@ -1,4 +1,11 @@
-import csv
+import argparse
+import os
+
+from inventory_columns import load_inventory, format_value
+from parallel_ingest import load_inventory_parallel
+from external_sort import write_danger, DEFAULT_MEMORY_MB
+from inventory_query import FlammabilityIndex
+from inventory_binary import write_inventory, InventoryBinaryReader, format_record
 
 file_path = 'D:/study/codysseycode/2주차/Mars_Base_Inventory_List.csv'
 
@@ -6,71 +13,95 @@ result_path = './2주차/Mars_Base_Inventory_danger.csv'
 
 result_bin = './2주차/Mars_Base_Inventory_List.bin'
 
-data = list()
-
-
-try:
-    # csv파일을 읽기모드 'r'로 열기(인코딩 'cp949')
-    with open(file_path, 'r', encoding='utf-8') as file:
-        csv_reader = csv.reader(file) # 파일 객체를 csv.reader의 인자로 전달해 새로운 reader 객체 생성
-        for row in csv_reader: 
-            print(row)
-            data.append(row)
+# 이 크기 이상인 CSV 는 여러 프로세스로 나눠 읽음 (작은 파일은 프로세스 시작 비용이 더 큼)
+PARALLEL_THRESHOLD = 64 * 1024 * 1024
 
-    # 마지막 5번째 항목만 float 변환 (예외 처리 추가)
-    for row in data:
-        try:
-            row[-1] = float(row[-1])  # 숫자로 변환 가능한 경우 변환
-        except ValueError:
-            pass  # 변환 불가능하면 그대로 둠 ( 맨처음 줄이 문자열만 있기 때문에 )
-
-
-    sorted_data = [data[0]] + sorted(
-        data[1:], 
-        # 인화성 수치가 높은 순으로 정렬 ( 처음에 문자열 있으니 문자열은 만나면 최상위 배치 )
-        key=lambda x: float(x[-1]) if isinstance(x[-1], (int, float)) else float('-inf'), 
-        reverse=True
-    )
 
+def print_binary(path):
     print('---------------------------------------------')
-    for row in sorted_data:
-        print(row)
-
+    # 메모리 맵으로 열어서 레코드를 바로 꺼내 읽기 (디코딩/분리 없음)
+    with InventoryBinaryReader(path) as reader:
+        print(reader.header)
+        for record in reader:
+            print(format_record(record))  # 즉시 출력
+
+
+def main(file_path, parallel=None, memory_mb=None):
+    """
+    parallel: True/False 로 읽기 방식 지정, None 이면 파일 크기로 결정
+    memory_mb: 주면 전체를 메모리에 올리지 않고 이 예산 안에서 외부 정렬로 위험 물질만 추림
+    """
+    try:
+        if memory_mb is not None:
+            # 메모리보다 큰 파일: 정렬된 런 파일을 병합하며 위험 물질 CSV / 바이너리로 바로 흘려 씀
+            count = write_danger(file_path, result_path, result_bin, 0.7, memory_mb)
+            print(f'위험 물질 {count}건 저장 완료: {result_path}')
+            print_binary(result_bin)
+            return
+
+        # csv 파일을 열 단위 배열로 읽기 (숫자가 아닌 값은 NaN)
+        if parallel is None:
+            parallel = os.path.getsize(file_path) >= PARALLEL_THRESHOLD
+        if parallel:
+            inventory = load_inventory_parallel(file_path)
+        else:
+            inventory = load_inventory(file_path)
+
+        print(inventory.header)
+        for row in inventory.rows(range(len(inventory))):
+            print(row)
 
-    # 인화성 수치가 0.7 이상 인것만 추출해서 넣는데 문자열을 만나면 무시
-    danger_flam = list(filter(lambda x: x[-1] > 0.7 if isinstance(x[-1], (int, float)) else False, sorted_data))
+        # 인화성 수치가 높은 순으로 정렬 (배열 연산, NaN은 맨 뒤)
+        sorted_index = inventory.sorted_by_flammability()
 
-    print('---------------------------------------------')
-    for row in danger_flam:
-        print(row)
+        print('---------------------------------------------')
+        print(inventory.header)
+        for row in inventory.rows(sorted_index):
+            print(row)
 
-    with open(result_path,'w', encoding='utf-8') as file:
-        for row in danger_flam:
-            file.write(",".join(map(str, row)) + "\n")
 
+        # 인화성 색인을 한 번 만들어 두고 0.7 초과 구간만 이진 탐색으로 추출
+        flam_index = FlammabilityIndex(inventory)
+        danger_index = flam_index.above(0.7)
+        danger_flam = [list(map(format_value, row)) for row in inventory.rows(danger_index)]
 
-    #--------------------------------------- 추가 문제 부분 : 바이너리 파일로 데이터 저장 --------------------------------------------
-    with open(result_bin, 'wb') as file:
+        print('---------------------------------------------')
         for row in danger_flam:
-            line = ",".join(map(str, row)) + "\n"  # 리스트를 문자열로 변환
-            file.write(line.encode("utf-8"))  # 문자열을 바이트로 변환 후 저장
-
+            print(row)
 
-    print('---------------------------------------------')
-    with open(result_bin, 'rb') as file:
-        for line in file:
-            row = line.decode("utf-8").strip().split(",")  # 바이트 → 문자열 변환 후 리스트로 변환
-            print(row)  # 즉시 출력
-
-#파일 찾을수 없을때
-except FileNotFoundError:
- print(f'파일을 찾을 수 없습니다. ')
-# 권한 없을떄
-except PermissionError:
- print(f'파일에 접근할 권한이 없습니다.')
-#인코딩 문제
-except UnicodeDecodeError:
- print(f'파일 인코딩 문제 발생. 다른 인코딩을 시도해 보세요. ')
-#이외 오류
-except Exception as e:
- print(f'오류 발생: {e}')
\ No newline at end of file
+        with open(result_path,'w', encoding='utf-8') as file:
+            for row in danger_flam:
+                file.write(",".join(row) + "\n")
+
+
+        #--------------------------------------- 추가 문제 부분 : 바이너리 파일로 데이터 저장 --------------------------------------------
+        # 헤더 + 문자열 테이블 + 32바이트 고정 폭 레코드 형식으로 저장
+        write_inventory(result_bin, inventory, danger_index)
+        print_binary(result_bin)
+
+    #파일 찾을수 없을때
+    except FileNotFoundError:
+     print(f'파일을 찾을 수 없습니다. ')
+    # 권한 없을떄
+    except PermissionError:
+     print(f'파일에 접근할 권한이 없습니다.')
+    #인코딩 문제
+    except UnicodeDecodeError:
+     print(f'파일 인코딩 문제 발생. 다른 인코딩을 시도해 보세요. ')
+    #이외 오류
+    except Exception as e:
+     print(f'오류 발생: {e}')
+
+
+# 프로세스 풀 작업자가 이 스크립트를 다시 실행하지 않도록 보호
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='화성 기지 인벤토리 위험 물질 추출')
+    parser.add_argument('csv', nargs='?', default=file_path, help='인벤토리 CSV 경로')
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--parallel', dest='parallel', action='store_true', default=None, help='여러 프로세스로 나눠 읽기')
+    mode.add_argument('--serial', dest='parallel', action='store_false', help='한 프로세스로 읽기')
+    mode.add_argument('--external', action='store_true', help='전체를 메모리에 올리지 않고 외부 정렬로 처리')
+    parser.add_argument('--memory-mb', type=float, default=DEFAULT_MEMORY_MB,
+                        help=f'--external 에서 쓸 메모리 예산 (MB, 기본 {DEFAULT_MEMORY_MB})')
+    args = parser.parse_args()
+    main(args.csv, args.parallel, args.memory_mb if args.external else None)
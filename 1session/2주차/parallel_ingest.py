@@ -0,0 +1,74 @@
+import csv
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from inventory_columns import CSV_ENCODING, NUMERIC_COLUMNS, Inventory, StringColumn, build_inventory, to_float
+
+# 작업자 하나가 맡는 바이트 구간 크기
+CHUNK_SIZE = 32 * 1024 * 1024
+
+
+def split_chunks(file_path, chunk_size=CHUNK_SIZE):
+    """
+    헤더 다음부터 파일을 줄 경계에 맞춘 (시작, 끝) 구간으로 나눈다.
+    (필드 안에 개행이 들어간 CSV 는 지원하지 않음)
+    """
+    size = os.path.getsize(file_path)
+    with open(file_path, 'rb') as f:
+        header = f.readline()
+        start = f.tell()
+        chunks = []
+        while start < size:
+            end = min(start + chunk_size, size)
+            if end < size:
+                f.seek(end)
+                f.readline()
+                end = f.tell()
+            chunks.append((file_path, start, end))
+            start = end
+    return header.decode(CSV_ENCODING), chunks
+
+
+def parse_chunk(args):
+    # 작업자 프로세스: 구간 하나를 열 배열로 변환해서 돌려줌
+    # (행 리스트 대신 숫자 배열 + UTF-8 바이트 덩어리라 프로세스 간 전달(pickle) 비용이 작음)
+    file_path, start, end, header = args
+    with open(file_path, 'rb') as f:
+        f.seek(start)
+        text = f.read(end - start).decode('utf-8')
+
+    numeric = [name in NUMERIC_COLUMNS for name in header]
+    values = [[] for _ in header]
+    for row in csv.reader(io.StringIO(text)):
+        if not row:
+            continue
+        for position, field in enumerate(row):
+            values[position].append(to_float(field) if numeric[position] else field)
+    return build_inventory(header, values).columns
+
+
+def load_inventory_parallel(file_path, workers=None, chunk_size=CHUNK_SIZE):
+    """
+    인벤토리 CSV를 여러 프로세스로 나눠 읽어 하나의 Inventory 로 합친다.
+    구간 순서대로 이어 붙이므로 결과 행 순서는 원본과 같다.
+    """
+    header_line, chunks = split_chunks(file_path, chunk_size)
+    header = next(csv.reader([header_line]))
+    tasks = [(path, start, end, header) for path, start, end in chunks]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        parts = list(pool.map(parse_chunk, tasks))
+
+    if not parts:
+        return build_inventory(header, [[] for _ in header])
+    columns = {}
+    for name in header:
+        column_parts = [part[name] for part in parts]
+        if isinstance(column_parts[0], StringColumn):
+            columns[name] = StringColumn.concat(column_parts)
+        else:
+            columns[name] = np.concatenate(column_parts)
+    return Inventory(header, columns)
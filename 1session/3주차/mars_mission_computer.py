@@ -2,8 +2,12 @@
 import random
 from datetime import datetime
 
+from sensor_logger import BufferedLogWriter
+
+LOG_PATH = './3주차/sensor_log.txt'
+
 class DummySensor:
-    def __init__(self):
+    def __init__(self, log_writer=None):
         self.env_values = {
             'mars_base_internal_temperature': 0.0,     # 화성 기지 내부 온도
             'mars_base_external_temperature': 0.0,     # 화성 기지 외부 온도
@@ -12,6 +16,8 @@ class DummySensor:
             'mars_base_internal_co2': 0.0,             # 화성 기지 내부 이산화탄소 농도
             'mars_base_internal_oxygen': 0.0           # 화성 기지 내부 산소 농도
         }
+        # 로그 파일은 한 번만 열어 두고 버퍼에 모아서 기록 (매번 열고 닫지 않음)
+        self.log_writer = log_writer or BufferedLogWriter(LOG_PATH)
 
     def set_env(self):
         self.env_values['mars_base_internal_temperature'] = random.randint(18, 30)
@@ -34,8 +40,7 @@ class DummySensor:
         )
 
         # 로그 파일에 기록
-        with open('./3주차/sensor_log.txt', 'a',encoding='utf-8') as log_file:
-            log_file.write(log_line)
+        self.log_writer.write(log_line)
 
         return self.env_values
     
@@ -0,0 +1,154 @@
+import json
+import os
+
+# 기본 규칙 파일 (이 파일과 같은 폴더)
+DEFAULT_RULES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'alert_rules.json')
+
+RAISED = 'raised'
+CLEARED = 'cleared'
+
+
+class ThresholdRule:
+    """
+    값이 기준을 넘으면 경보, clear 기준으로 돌아와야 해제 (히스테리시스).
+    예) CO2 > 0.09 이면 경보, < 0.08 이 되어야 해제
+    """
+    __slots__ = ('name', 'channel', 'above', 'value', 'clear', 'active')
+
+    def __init__(self, name, channel, op, value, clear=None):
+        self.name = name
+        self.channel = channel
+        self.above = op == '>'
+        self.value = value
+        self.clear = value if clear is None else clear
+        self.active = False
+
+    def check(self, timestamp, value):
+        if self.above:
+            if not self.active and value > self.value:
+                self.active = True
+                return RAISED
+            if self.active and value < self.clear:
+                self.active = False
+                return CLEARED
+        else:
+            if not self.active and value < self.value:
+                self.active = True
+                return RAISED
+            if self.active and value > self.clear:
+                self.active = False
+                return CLEARED
+        return None
+
+
+class RateRule:
+    """직전 측정값 대비 초당 변화량(절대값)이 per_second 를 넘으면 경보, clear 이하로 내려오면 해제"""
+    __slots__ = ('name', 'channel', 'per_second', 'clear', 'active', 'last_time', 'last_value')
+
+    def __init__(self, name, channel, per_second, clear=None):
+        self.name = name
+        self.channel = channel
+        self.per_second = per_second
+        self.clear = per_second if clear is None else clear
+        self.active = False
+        self.last_time = None
+        self.last_value = None
+
+    def check(self, timestamp, value):
+        last_time = self.last_time
+        last_value = self.last_value
+        self.last_time = timestamp
+        self.last_value = value
+        if last_time is None or timestamp <= last_time:
+            return None
+        rate = abs(value - last_value) / (timestamp - last_time)
+        if not self.active and rate > self.per_second:
+            self.active = True
+            return RAISED
+        if self.active and rate <= self.clear:
+            self.active = False
+            return CLEARED
+        return None
+
+
+class NOfMRule:
+    """
+    최근 m 번 중 n 번 이상 조건을 만족하면 경보, clear 번 이하로 줄면 해제.
+    최근 m 개의 참/거짓은 링 버퍼와 누적 개수로 관리해서 O(1).
+    """
+    __slots__ = ('name', 'channel', 'above', 'value', 'n', 'm', 'clear',
+                 'active', 'window', 'position', 'hits')
+
+    def __init__(self, name, channel, op, value, n, m, clear=None):
+        if not 0 < n <= m:
+            raise ValueError(f'{name}: n 은 1 이상 m 이하여야 합니다.')
+        self.name = name
+        self.channel = channel
+        self.above = op == '>'
+        self.value = value
+        self.n = n
+        self.m = m
+        self.clear = n - 1 if clear is None else clear
+        self.active = False
+        self.window = [False] * m
+        self.position = 0
+        self.hits = 0
+
+    def check(self, timestamp, value):
+        hit = value > self.value if self.above else value < self.value
+        position = self.position
+        self.hits += hit - self.window[position]
+        self.window[position] = hit
+        self.position = (position + 1) % self.m
+        if not self.active and self.hits >= self.n:
+            self.active = True
+            return RAISED
+        if self.active and self.hits <= self.clear:
+            self.active = False
+            return CLEARED
+        return None
+
+
+RULE_TYPES = {
+    'threshold': lambda c: ThresholdRule(c['name'], c['channel'], c['op'], c['value'], c.get('clear')),
+    'rate': lambda c: RateRule(c['name'], c['channel'], c['per_second'], c.get('clear')),
+    'n_of_m': lambda c: NOfMRule(c['name'], c['channel'], c['op'], c['value'], c['n'], c['m'], c.get('clear')),
+}
+
+
+def compile_rule(config):
+    rule_type = config.get('type')
+    if rule_type not in RULE_TYPES:
+        raise ValueError(f"알 수 없는 규칙 종류입니다: {rule_type}")
+    if config.get('op', '>') not in ('>', '<'):
+        raise ValueError(f"{config.get('name')}: op 는 '>' 또는 '<' 만 가능합니다.")
+    return RULE_TYPES[rule_type](config)
+
+
+class AlertEngine:
+    """
+    설정 파일의 규칙을 한 번만 객체로 만들어 두고 측정값마다 O(규칙 수) 로 평가한다.
+    evaluate() 는 상태가 바뀐 규칙만 (시각, 규칙 이름, 'raised'/'cleared', 값) 으로 돌려준다.
+    """
+
+    def __init__(self, rules):
+        self.rules = rules
+        # 평가 시 속성 조회를 줄이기 위해 (채널, check 함수, 이름) 로 미리 묶어 둠
+        self._bindings = [(rule.channel, rule.check, rule.name) for rule in rules]
+
+    @classmethod
+    def from_config(cls, path=DEFAULT_RULES):
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls([compile_rule(config) for config in json.load(f)])
+
+    def evaluate(self, timestamp, env_values):
+        events = []
+        for channel, check, name in self._bindings:
+            value = env_values[channel]
+            state = check(timestamp, value)
+            if state:
+                events.append((timestamp, name, state, value))
+        return events
+
+    def active(self):
+        return [rule.name for rule in self.rules if rule.active]
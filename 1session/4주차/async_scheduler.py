@@ -0,0 +1,158 @@
+import argparse
+import asyncio
+import signal
+import time
+
+
+class SensorSource:
+    # 스케줄러에 등록된 센서 하나의 상태와 통계
+    def __init__(self, name, sensor, period, on_reading=None):
+        self.name = name
+        self.sensor = sensor
+        self.period = period
+        self.on_reading = on_reading
+        self.latest = None
+        self.ticks = 0
+        self.missed = 0          # 늦어져서 건너뛴 주기 수
+        self.max_lateness = 0.0  # 예정 시각보다 가장 늦게 실행된 정도 (초)
+        self.errors = 0          # 측정/처리 중 예외가 난 주기 수
+        self.last_error = None
+
+
+class SensorScheduler:
+    """
+    여러 센서를 각자의 주기로 asyncio 에서 돌린다.
+    - 매 측정 시각을 '시작 시각 + k x 주기' 절대 시각으로 잡아서 작업 시간만큼 밀리지 않음
+    - 작업이 주기보다 오래 걸리면 밀린 주기는 건너뛰고 missed 로 집계
+    - 센서 하나가 예외를 내도 그 주기만 errors 로 집계하고 계속 돌림 (다른 센서는 영향 없음)
+    - 종료는 작업 취소(cancel)로 처리 (input() 스레드 불필요)
+    """
+
+    def __init__(self):
+        self.sources = []
+        self._stop = None
+
+    def add_source(self, name, sensor, period, on_reading=None):
+        source = SensorSource(name, sensor, period, on_reading)
+        self.sources.append(source)
+        return source
+
+    async def _run_source(self, source, start):
+        loop = asyncio.get_running_loop()
+        tick = 0
+        while True:
+            deadline = start + tick * source.period
+            delay = deadline - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            source.max_lateness = max(source.max_lateness, loop.time() - deadline)
+
+            try:
+                source.sensor.set_env()
+                if getattr(source.sensor, 'finished', False):
+                    return
+                env_values = source.sensor.get_env()
+                timestamp = getattr(source.sensor, 'timestamp', None) or time.time()
+                source.latest = env_values
+                source.ticks += 1
+                if source.on_reading:
+                    source.on_reading(env_values, timestamp)
+            except Exception as e:
+                source.errors += 1
+                source.last_error = e
+                if source.errors == 1:
+                    print(f'[센서 오류] {source.name}: {e!r} (이후 같은 센서의 오류는 집계만 함)')
+
+            tick += 1
+            late = loop.time() - (start + tick * source.period)
+            if late > 0:
+                skipped = int(late // source.period) + 1
+                source.missed += skipped
+                tick += skipped
+
+    def stop(self):
+        if self._stop is not None:
+            self._stop.set()
+
+    async def run_async(self, duration=None):
+        loop = asyncio.get_running_loop()
+        self._stop = asyncio.Event()
+        try:
+            loop.add_signal_handler(signal.SIGINT, self.stop)
+            loop.add_signal_handler(signal.SIGTERM, self.stop)
+            signals = True
+        except (NotImplementedError, RuntimeError):
+            signals = False  # Windows 등: Ctrl+C 는 KeyboardInterrupt 로 처리
+
+        start = loop.time()
+        tasks = [asyncio.create_task(self._run_source(source, start)) for source in self.sources]
+        all_done = asyncio.gather(*tasks)
+        stop_wait = asyncio.create_task(self._stop.wait())
+        try:
+            await asyncio.wait([all_done, stop_wait], timeout=duration, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in tasks:
+                task.cancel()
+            stop_wait.cancel()
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            await asyncio.gather(stop_wait, return_exceptions=True)
+            # all_done 의 결과는 아래에서 작업별로 확인하므로 '가져가지 않은 예외' 경고만 막음
+            if all_done.done() and not all_done.cancelled():
+                all_done.exception()
+            if signals:
+                loop.remove_signal_handler(signal.SIGINT)
+                loop.remove_signal_handler(signal.SIGTERM)
+
+        # 주기별 오류는 _run_source 에서 처리하므로 여기까지 온 예외는 스케줄러 자체의 문제
+        failures = [
+            (source, result) for source, result in zip(self.sources, results)
+            if isinstance(result, Exception) and not isinstance(result, asyncio.CancelledError)
+        ]
+        if failures:
+            source, error = failures[0]
+            raise RuntimeError(f'센서 작업이 비정상 종료되었습니다: {source.name} ({len(failures)}개)') from error
+
+    def run(self, duration=None):
+        try:
+            asyncio.run(self.run_async(duration))
+        except KeyboardInterrupt:
+            pass
+
+    def report(self):
+        total_ticks = sum(source.ticks for source in self.sources)
+        total_missed = sum(source.missed for source in self.sources)
+        total_errors = sum(source.errors for source in self.sources)
+        worst = max((source.max_lateness for source in self.sources), default=0.0)
+        return {
+            'sources': len(self.sources),
+            'ticks': total_ticks,
+            'missed': total_missed,
+            'errors': total_errors,
+            'max_lateness_ms': round(worst * 1000, 3)
+        }
+
+
+def main():
+    from main import DummySensor
+    from sensor_logger import BufferedLogWriter
+
+    parser = argparse.ArgumentParser(description='asyncio 센서 스케줄러')
+    parser.add_argument('--sensors', type=int, default=100, help='돌릴 센서 수')
+    parser.add_argument('--period', type=float, default=1.0, help='기본 측정 주기 (초)')
+    parser.add_argument('--duration', type=float, default=10.0, help='실행 시간 (초)')
+    parser.add_argument('--log', default='./3주차/sensor_log.txt', help='센서 로그 경로')
+    args = parser.parse_args()
+
+    scheduler = SensorScheduler()
+    with BufferedLogWriter(args.log) as log_writer:
+        for number in range(args.sensors):
+            # 센서마다 주기를 조금씩 다르게 (1배, 2배, 5배)
+            period = args.period * (1, 2, 5)[number % 3]
+            scheduler.add_source(f'sensor-{number}', DummySensor(log_writer=log_writer), period)
+        scheduler.run(args.duration)
+
+    print(scheduler.report())
+
+
+if __name__ == '__main__':
+    main()
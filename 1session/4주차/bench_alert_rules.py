@@ -0,0 +1,49 @@
+import argparse
+import random
+import time
+
+from alert_rules import AlertEngine, DEFAULT_RULES
+from sensor_channels import CHANNELS, RANGES
+
+# 목표 처리량 (건/초)
+TARGET = 100_000
+
+
+def make_readings(count, seed=0):
+    # DummySensor.set_env 와 같은 범위의 측정값을 미리 만들어 둠 (생성 시간은 측정에서 제외)
+    rng = random.Random(seed)
+    readings = []
+    for _ in range(count):
+        env_values = {}
+        for name in CHANNELS:
+            low, high, digits = RANGES[name]
+            if digits is None:
+                env_values[name] = rng.randint(low, high)
+            else:
+                env_values[name] = round(rng.uniform(low, high), digits)
+        readings.append(env_values)
+    return readings
+
+
+def main():
+    parser = argparse.ArgumentParser(description='경보 규칙 엔진 처리량 측정')
+    parser.add_argument('--readings', type=int, default=1_000_000)
+    parser.add_argument('--rules', default=DEFAULT_RULES, help='규칙 설정 파일')
+    args = parser.parse_args()
+
+    readings = make_readings(args.readings)
+    engine = AlertEngine.from_config(args.rules)
+
+    events = 0
+    start = time.perf_counter()
+    for index, env_values in enumerate(readings):
+        events += len(engine.evaluate(index * 0.01, env_values))
+    elapsed = time.perf_counter() - start
+
+    rate = args.readings / elapsed
+    print(f'규칙 {len(engine.rules)}개, 측정값 {args.readings}건, 경보 변화 {events}건')
+    print(f'{elapsed:.2f}초 ({rate:,.0f}건/초) - 목표 {TARGET:,}건/초 {"달성" if rate >= TARGET else "미달"}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+import argparse
+import time
+
+import numpy as np
+
+from sensor_channels import CHANNELS, RANGES
+
+
+class SensorFleet:
+    """
+    수많은 가상 DummySensor 를 한꺼번에 흉내 낸다.
+    - 모든 센서 값은 (센서 수 x 6) 연속 배열 하나에 보관
+    - tick() 한 번에 전체 센서의 새 값을 numpy 로 한꺼번에 생성 (set_env 와 같은 범위)
+    - 센서마다 dict 를 만들지 않고 배열 그대로 내보냄
+    """
+
+    def __init__(self, size, seed=None):
+        self.size = size
+        self.rng = np.random.default_rng(seed)
+        self.values = np.zeros((size, len(CHANNELS)), dtype=np.float64)
+        self.timestamp = 0
+        self.ticks = 0
+
+        low, span, scale, int_columns = [], [], [], []
+        for column, name in enumerate(CHANNELS):
+            minimum, maximum, digits = RANGES[name]
+            low.append(minimum)
+            if digits is None:
+                # random.randint 처럼 최댓값 포함 → 버림 전에 폭을 1 늘림
+                span.append(maximum - minimum + 1)
+                int_columns.append(column)
+            else:
+                span.append(maximum - minimum)
+                scale.append(10 ** digits)
+        self._low = np.array(low, dtype=np.float64)
+        self._span = np.array(span, dtype=np.float64)
+        self._scale = np.array(scale, dtype=np.float64)
+        self._int_columns = np.array(int_columns)
+        self._float_columns = np.array([c for c in range(len(CHANNELS)) if c not in int_columns])
+
+    def tick(self, timestamp=None):
+        # 모든 센서의 값을 한 번에 갱신하고 (size x 6) 배열을 반환
+        # 난수는 (size x 6) 한 번에 뽑고 채널별 범위/반올림은 브로드캐스트로 적용
+        np.multiply(self.rng.random((self.size, len(CHANNELS))), self._span, out=self.values)
+        self.values += self._low
+        self.values[:, self._int_columns] = np.floor(self.values[:, self._int_columns])
+        self.values[:, self._float_columns] = (
+            np.round(self.values[:, self._float_columns] * self._scale) / self._scale
+        )
+        self.timestamp = int(time.time()) if timestamp is None else timestamp
+        self.ticks += 1
+        return self.values
+
+    def to_records(self):
+        # 구조화 배열 (센서 번호, 시각, 6개 채널) 로 한꺼번에 내보내기
+        dtype = [('sensor', '<u4'), ('timestamp', '<i8')] + [(name, '<f8') for name in CHANNELS]
+        records = np.empty(self.size, dtype=dtype)
+        records['sensor'] = np.arange(self.size)
+        records['timestamp'] = self.timestamp
+        for column, name in enumerate(CHANNELS):
+            records[name] = self.values[:, column]
+        return records
+
+    def env_values(self, sensor):
+        # 센서 하나의 값을 DummySensor.get_env 와 같은 dict 형태로 (디버깅용)
+        return {name: self.values[sensor, column].item() for column, name in enumerate(CHANNELS)}
+
+
+def run(size, ticks, rate=1.0, output=None, seed=None):
+    """
+    rate(Hz) 주기로 ticks 번 전체 센서 값을 만들고,
+    output 이 있으면 매 tick 을 바이너리 레코드로 한꺼번에 덧붙인다.
+    """
+    fleet = SensorFleet(size, seed)
+    period = 1.0 / rate if rate > 0 else 0.0
+    out = open(output, 'ab') if output else None
+    generated = 0.0
+    start = time.perf_counter()
+    try:
+        for tick in range(ticks):
+            deadline = start + tick * period
+            delay = deadline - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            t0 = time.perf_counter()
+            fleet.tick()
+            if out:
+                out.write(fleet.to_records().tobytes())
+            generated += time.perf_counter() - t0
+    finally:
+        if out:
+            out.close()
+    return fleet, generated
+
+
+def main():
+    parser = argparse.ArgumentParser(description='가상 센서 대량 시뮬레이터')
+    parser.add_argument('--sensors', type=int, default=100_000)
+    parser.add_argument('--ticks', type=int, default=10)
+    parser.add_argument('--rate', type=float, default=1.0, help='초당 tick 수 (0 이면 최대 속도)')
+    parser.add_argument('--output', help='레코드를 덧붙여 저장할 바이너리 파일')
+    parser.add_argument('--seed', type=int)
+    args = parser.parse_args()
+
+    fleet, generated = run(args.sensors, args.ticks, args.rate, args.output, args.seed)
+    readings = args.sensors * args.ticks
+    print(f'센서 {args.sensors}개 x {args.ticks}tick = {readings}건 생성')
+    print(f'생성에 걸린 시간: {generated:.3f}초 ({readings / max(generated, 1e-9):,.0f}건/초)')
+    print('센서 0 마지막 값:', fleet.env_values(0))
+
+
+if __name__ == '__main__':
+    main()
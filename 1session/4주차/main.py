@@ -1,11 +1,24 @@
+import argparse
 import time
 import json
 import random
 import threading
 from datetime import datetime
 
+from sensor_logger import BufferedLogWriter
+from rolling_stats import RollingStats
+from quantile_sketch import ChannelSketches
+from alert_rules import AlertEngine, RAISED
+from rollup_store import RollupStore
+from sensor_codec import CompressedSensorLog
+from shared_board import SharedBoardPublisher
+
+LOG_PATH = './3주차/sensor_log.txt'
+ROLLUP_PATH = './4주차/sensor_rollup'
+COMPRESSED_LOG_PATH = './4주차/sensor_log.gz2'
+
 class DummySensor:
-    def __init__(self):
+    def __init__(self, log_writer=None, binary_log=None):
         self.env_values = {
             'mars_base_internal_temperature': 0.0,     # 화성 기지 내부 온도
             'mars_base_external_temperature': 0.0,     # 화성 기지 외부 온도
@@ -14,6 +27,10 @@ class DummySensor:
             'mars_base_internal_co2': 0.0,             # 화성 기지 내부 이산화탄소 농도
             'mars_base_internal_oxygen': 0.0           # 화성 기지 내부 산소 농도
         }
+        # 바이너리 로그 모드 (32바이트 고정 폭 레코드)
+        self.binary_log = binary_log
+        # 로그 파일은 한 번만 열어 두고 버퍼에 모아서 기록 (매번 열고 닫지 않음)
+        self.log_writer = None if binary_log else (log_writer or BufferedLogWriter(LOG_PATH))
 
     def set_env(self):
         self.env_values['mars_base_internal_temperature'] = random.randint(18, 30)
@@ -24,6 +41,10 @@ class DummySensor:
         self.env_values['mars_base_internal_oxygen'] = round(random.uniform(4.0, 7.0), 2)
 
     def get_env(self):
+        if self.binary_log:
+            self.binary_log.append(time.time(), self.env_values)
+            return self.env_values
+
         now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         log_line = (
             f"{now}, "
@@ -35,55 +56,94 @@ class DummySensor:
             f"{self.env_values['mars_base_internal_oxygen']}%\n"
         )
 
-        with open('./3주차/sensor_log.txt', 'a', encoding='utf-8') as log_file:
-            log_file.write(log_line)
+        self.log_writer.write(log_line)
 
         return self.env_values
 
 
 class MissionComputer:
-    def __init__(self):
-        self.sensor = DummySensor()
+    def __init__(self, sensor=None, interval=5, verbose=True, board=None, store=None):
+        # sensor 를 바꿔 끼우면 기록된 로그 재생(ReplaySensor) 등으로 테스트할 수 있음
+        self.sensor = sensor or DummySensor()
+        self.interval = interval   # 측정 간격 (초), 0 이면 기다리지 않음
+        self.verbose = verbose     # 매 측정값 출력 여부
         self.env_values = {}
         self.running = True
-        self.data_log = []
+        # 측정값 목록 대신 1분/5분/1시간 구간 통계를 고정 메모리로 유지
+        self.stats = RollingStats()
+        self.average_start = None
+        # 채널별 분위수 스케치 (다른 MissionComputer 의 스케치와 merge 가능)
+        self.sketches = ChannelSketches()
+        # 위험 값 경보 규칙 (alert_rules.json 을 한 번만 읽어서 준비)
+        self.alerts = AlertEngine.from_config()
+        # 최신 값을 다른 프로세스와 나누는 공유 메모리 보드 (SharedBoardPublisher, 선택)
+        self.board = board
+        # 측정값과 1분/5분/1시간 집계를 디스크에 남기는 저장소 (RollupStore, 선택)
+        self.store = store
+
+    def now(self):
+        # 재생 센서는 기록된 시각을, 실제 센서는 현재 시각을 기준으로 함
+        timestamp = getattr(self.sensor, 'timestamp', None)
+        return time.time() if timestamp is None else timestamp
 
     def get_sensor_data(self):
-        start_time = time.time()
-
         while self.running:
             self.sensor.set_env()
-            self.env_values = self.sensor.get_env()
-            self.data_log.append(self.env_values)
-
-            print(json.dumps(self.env_values, indent=2, ensure_ascii=False))
-
-            # 5분마다 평균 계산 및 출력
-            elapsed = time.time() - start_time
-            if elapsed >= 300:  # 5분 = 300초
-                self.print_average()
-                self.data_log.clear()
-                start_time = time.time()
+            if getattr(self.sensor, 'finished', False):
+                break
+            self.record(self.sensor.get_env())
 
-            time.sleep(5)
+            if self.interval:
+                time.sleep(self.interval)
 
         print("System stopped...")
 
-    def print_average(self):
-        if not self.data_log:
+    def record(self, env_values, timestamp=None):
+        # 측정값 하나를 반영 (스레드 루프와 asyncio 스케줄러가 함께 사용)
+        if timestamp is None:
+            timestamp = self.now()
+        self.env_values = env_values
+        if self.board is not None:
+            self.board.publish(timestamp, env_values)
+        self.stats.add(timestamp, env_values)
+        if self.store is not None:
+            self.store.add(timestamp, env_values)
+        self.sketches.add(env_values)
+
+        for event_time, name, state, value in self.alerts.evaluate(timestamp, env_values):
+            when = datetime.fromtimestamp(event_time).strftime("%Y-%m-%d %H:%M:%S")
+            label = '경보 발생' if state == RAISED else '경보 해제'
+            print(f"[{label} - {when}] {name} (값: {value})")
+
+        if self.verbose:
+            print(json.dumps(env_values, indent=2, ensure_ascii=False))
+
+        # 5분마다 평균 계산 및 출력
+        if self.average_start is None:
+            self.average_start = timestamp
+        elapsed = timestamp - self.average_start
+        if elapsed >= 300:  # 5분 = 300초
+            self.print_average()
+            self.average_start = timestamp
+
+    def print_average(self, window='5min'):
+        avg_values = self.stats.averages(window, self.now())
+        if all(value is None for value in avg_values.values()):
             return
 
-        avg_values = {}
-        keys = self.data_log[0].keys()
-
-        for key in keys:
-            total = sum(item[key] for item in self.data_log)
-            avg = round(total / len(self.data_log), 4)
-            avg_values[key] = avg
-
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        now = datetime.fromtimestamp(self.now()).strftime("%Y-%m-%d %H:%M:%S")
         print(f"\n[5분 평균 출력 - {now}]")
         print(json.dumps(avg_values, indent=2, ensure_ascii=False))
+        self.print_percentiles()
+
+    def print_percentiles(self):
+        # 전체 측정값의 p50/p95/p99, 최소/최대 (스케치라 메모리는 일정)
+        summary = {
+            name: {label: round(value, 4) for label, value in stats.items()} if stats else None
+            for name, stats in self.sketches.summary().items()
+        }
+        print("[분위수 요약]")
+        print(json.dumps(summary, indent=2, ensure_ascii=False))
 
     def listen_for_stop(self):
         input("종료하려면 Enter 키를 누르세요...\n")
@@ -99,6 +159,51 @@ class MissionComputer:
         sensor_thread.join()
         stop_thread.join()
 
-# 실행
-RunComputer = MissionComputer()
-RunComputer.run()
+    def run_async(self, sources=None, duration=None):
+        """
+        asyncio 스케줄러로 실행한다. (스레드 + input() 대신 작업 취소로 종료)
+        sources: 추가로 돌릴 (이름, 센서, 주기) 목록
+        duration: 초 단위 실행 시간, None 이면 Ctrl+C 까지
+        """
+        from async_scheduler import SensorScheduler
+
+        scheduler = SensorScheduler()
+        scheduler.add_source('mission', self.sensor, self.interval or 5, self.record)
+        for name, sensor, period in sources or []:
+            scheduler.add_source(name, sensor, period)
+        scheduler.run(duration)
+        print("System stopped...")
+        return scheduler
+
+def main():
+    parser = argparse.ArgumentParser(description='화성 기지 미션 컴퓨터')
+    parser.add_argument('--interval', type=float, default=5, help='측정 간격 (초)')
+    parser.add_argument('--duration', type=float, help='실행 시간 (초), 생략하면 Ctrl+C 까지')
+    parser.add_argument('--threaded', action='store_true',
+                        help='asyncio 스케줄러 대신 예전 방식(스레드 + Enter 키 종료)으로 실행')
+    parser.add_argument('--compressed', nargs='?', const=COMPRESSED_LOG_PATH, metavar='PATH',
+                        help=f'텍스트 로그 대신 압축 센서 로그로 기록 (경로 생략 시 {COMPRESSED_LOG_PATH})')
+    args = parser.parse_args()
+
+    # 압축 로그는 블록 단위로 쌓다가 종료 시(또는 MAX_DELAY 초마다) 남은 블록을 기록
+    compressed = CompressedSensorLog(args.compressed) if args.compressed else None
+    # 최신 값은 공유 메모리 보드로 공개 (다른 프로세스에서 python shared_board.py 로 확인)
+    board = SharedBoardPublisher()
+    try:
+        with RollupStore(ROLLUP_PATH) as store:
+            sensor = DummySensor(binary_log=compressed) if compressed else None
+            RunComputer = MissionComputer(sensor=sensor, interval=args.interval, board=board, store=store)
+            if args.threaded:
+                RunComputer.run()
+            else:
+                print("종료하려면 Ctrl+C 를 누르세요...")
+                RunComputer.run_async(duration=args.duration)
+    finally:
+        board.close()
+        if compressed:
+            compressed.close()
+
+
+# 실행 (다른 모듈에서 import 할 때는 실행하지 않음)
+if __name__ == '__main__':
+    main()
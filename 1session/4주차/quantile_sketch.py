@@ -0,0 +1,138 @@
+import math
+import random
+
+from sensor_channels import CHANNELS
+
+# KLL 스케치 기본 크기 (클수록 정확, 메모리는 대략 3 x k 개 값)
+DEFAULT_K = 200
+
+# 아래 단계로 갈수록 버퍼 크기를 줄이는 비율
+SHRINK = 2 / 3
+
+
+class KLLSketch:
+    """
+    KLL 스트리밍 분위수 스케치.
+    - 값을 전부 보관하지 않고 여러 단계(level)의 버퍼만 유지 (메모리는 k 에 비례)
+    - 버퍼가 차면 정렬 후 하나 건너 하나만 윗단계로 올림 (윗단계 값은 가중치 2배)
+    - 같은 k 의 스케치끼리 merge 해서 여러 MissionComputer/구간을 합칠 수 있음
+    최소/최대는 따로 정확하게 기록한다.
+    """
+
+    def __init__(self, k=DEFAULT_K, seed=None):
+        self.k = k
+        self.levels = [[]]
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self.random = random.Random(seed)
+
+    def _capacity(self, level):
+        depth = len(self.levels) - level - 1
+        return max(2, int(math.ceil(self.k * SHRINK ** depth)))
+
+    def add(self, value):
+        self.levels[0].append(value)
+        self.count += 1
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        if len(self.levels[0]) >= self._capacity(0):
+            self._compress()
+
+    def _compress(self):
+        for level in range(len(self.levels)):
+            if len(self.levels[level]) < self._capacity(level):
+                continue
+            if level + 1 == len(self.levels):
+                self.levels.append([])
+            buffer = sorted(self.levels[level])
+            # 홀수 개면 하나는 이 단계에 남김
+            keep = [buffer.pop()] if len(buffer) % 2 else []
+            offset = self.random.randint(0, 1)
+            self.levels[level + 1].extend(buffer[offset::2])
+            self.levels[level] = keep
+
+    def merge(self, other):
+        # 다른 스케치를 이 스케치에 합친다
+        if other.k != self.k:
+            raise ValueError('k 가 다른 스케치는 합칠 수 없습니다.')
+        while len(self.levels) < len(other.levels):
+            self.levels.append([])
+        for level, values in enumerate(other.levels):
+            self.levels[level].extend(values)
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        # 넘친 단계가 없어질 때까지 압축
+        while any(len(values) >= self._capacity(level) for level, values in enumerate(self.levels)):
+            self._compress()
+        return self
+
+    def quantile(self, q):
+        if not self.count:
+            return None
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+        weighted = sorted(
+            (value, 1 << level)
+            for level, values in enumerate(self.levels)
+            for value in values
+        )
+        total = sum(weight for _, weight in weighted)
+        target = q * total
+        seen = 0
+        for value, weight in weighted:
+            seen += weight
+            if seen >= target:
+                return value
+        return self.max
+
+    def size(self):
+        # 현재 보관 중인 값 개수 (메모리 사용량 확인용)
+        return sum(len(values) for values in self.levels)
+
+
+class ChannelSketches:
+    """env_values 채널마다 KLL 스케치를 하나씩 유지하고 p50/p95/p99 요약을 만든다."""
+
+    QUANTILES = {'p50': 0.5, 'p95': 0.95, 'p99': 0.99}
+
+    def __init__(self, k=DEFAULT_K, channels=CHANNELS):
+        self.k = k
+        self.channels = channels
+        self.sketches = {name: KLLSketch(k) for name in channels}
+
+    def add(self, env_values):
+        for name in self.channels:
+            self.sketches[name].add(env_values[name])
+
+    def merge(self, other):
+        for name in self.channels:
+            self.sketches[name].merge(other.sketches[name])
+        return self
+
+    def summary(self):
+        result = {}
+        for name, sketch in self.sketches.items():
+            if not sketch.count:
+                result[name] = None
+                continue
+            stats = {label: sketch.quantile(q) for label, q in self.QUANTILES.items()}
+            stats['min'] = sketch.min
+            stats['max'] = sketch.max
+            stats['count'] = sketch.count
+            result[name] = stats
+        return result
+
+
+def merge_all(sketch_sets):
+    # 여러 MissionComputer/구간의 ChannelSketches → 전체 요약용 하나
+    sketch_sets = list(sketch_sets)
+    merged = ChannelSketches(sketch_sets[0].k, sketch_sets[0].channels)
+    for sketches in sketch_sets:
+        merged.merge(sketches)
+    return merged
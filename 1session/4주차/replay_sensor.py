@@ -0,0 +1,100 @@
+import argparse
+import time
+
+from sensor_channels import CHANNELS
+from sensor_binlog import MAGIC as BINARY_MAGIC, SensorLogReader, parse_text_line
+from sensor_codec import MAGIC as COMPRESSED_MAGIC, CompressedSensorReader
+
+
+def read_records(path):
+    """
+    기록된 센서 로그를 (timestamp, env_values) 로 차례로 읽는다.
+    텍스트(sensor_log.txt), 32바이트 바이너리, 압축 로그를 파일 앞부분으로 구분한다.
+    """
+    with open(path, 'rb') as f:
+        magic = f.read(8)
+
+    if magic == BINARY_MAGIC:
+        with SensorLogReader(path) as reader:
+            for index in range(len(reader)):
+                yield int(reader.records['timestamp'][index]), reader.env_values(index)
+    elif magic == COMPRESSED_MAGIC:
+        yield from CompressedSensorReader(path).read()
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                parsed = parse_text_line(line)
+                if parsed:
+                    yield parsed
+
+
+class ReplaySensor:
+    """
+    DummySensor 대신 기록된 로그를 재생하는 센서.
+    - set_env(): 다음 기록으로 이동 (speed 배속에 맞춰 기다림, speed 0 이면 최대 속도)
+    - get_env(): 현재 기록의 env_values
+    - timestamp: 현재 기록의 시각 (MissionComputer 가 시간 계산에 사용)
+    - finished: 기록을 다 읽으면 True
+    """
+
+    def __init__(self, path, speed=1.0):
+        self.records = read_records(path)
+        self.speed = speed
+        self.env_values = {name: 0.0 for name in CHANNELS}
+        self.timestamp = None
+        self.finished = False
+        self.count = 0
+        self._wall_start = None
+        self._data_start = None
+
+    def set_env(self):
+        try:
+            timestamp, env_values = next(self.records)
+        except StopIteration:
+            self.finished = True
+            return
+
+        if self.speed > 0:
+            if self._wall_start is None:
+                self._wall_start = time.monotonic()
+                self._data_start = timestamp
+            # 기록된 간격 / 배속 만큼 지난 시점까지 기다림 (누적 오차 없음)
+            delay = self._wall_start + (timestamp - self._data_start) / self.speed - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+
+        self.timestamp = timestamp
+        self.env_values = env_values
+        self.count += 1
+
+    def get_env(self):
+        return self.env_values
+
+
+def main():
+    from main import MissionComputer
+
+    parser = argparse.ArgumentParser(description='기록된 센서 로그를 MissionComputer 로 재생')
+    parser.add_argument('log', help='sensor_log.txt 또는 바이너리/압축 센서 로그')
+    parser.add_argument('--speed', type=float, default=0, help='재생 배속 (0 이면 최대 속도)')
+    parser.add_argument('--verbose', action='store_true', help='측정값마다 출력')
+    args = parser.parse_args()
+
+    sensor = ReplaySensor(args.log, args.speed)
+    computer = MissionComputer(sensor=sensor, interval=0, verbose=args.verbose)
+
+    try:
+        start = time.perf_counter()
+        computer.get_sensor_data()
+        elapsed = time.perf_counter() - start
+    except FileNotFoundError as e:
+        print(f'파일을 찾을 수 없습니다: {e.filename}')
+        return
+    except KeyboardInterrupt:
+        elapsed = time.perf_counter() - start
+
+    print(f'\n재생 완료: {sensor.count}건, {elapsed:.2f}초 ({sensor.count / max(elapsed, 1e-9):,.0f}건/초)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+import math
+
+from sensor_channels import CHANNELS
+
+# 기본 집계 구간 (이름: 초)
+DEFAULT_WINDOWS = {
+    '1min': 60,
+    '5min': 300,
+    '1hour': 3600
+}
+
+# 구간 하나를 몇 칸의 링 버퍼로 나눌지 (칸 크기 = 구간 / 칸 수)
+DEFAULT_BUCKETS = 60
+
+
+class RollingWindow:
+    """
+    최근 seconds 초 동안의 채널별 평균/최소/최대를 유지한다.
+    - 구간을 buckets 칸의 링 버퍼로 나누고, 칸마다 개수/합/최소/최대만 보관
+    - 측정값 추가: O(채널 수), 메모리: 칸 수 x 채널 수 (측정값 개수와 무관)
+    - 합계는 누적 합으로 유지하므로 평균 조회 시 다시 더하지 않음
+    오래된 칸은 새 칸으로 넘어갈 때 비워진다. (정밀도 = 칸 크기)
+    """
+
+    def __init__(self, seconds, buckets=DEFAULT_BUCKETS, channels=len(CHANNELS)):
+        self.seconds = seconds
+        self.buckets = buckets
+        self.channels = channels
+        self.width = seconds / buckets
+        self.counts = [0] * buckets
+        self.sums = [[0.0] * channels for _ in range(buckets)]
+        self.mins = [[math.inf] * channels for _ in range(buckets)]
+        self.maxs = [[-math.inf] * channels for _ in range(buckets)]
+        self.total_count = 0
+        self.total_sums = [0.0] * channels
+        self.current = None   # 가장 최근 칸 번호 (절대값)
+
+    def _clear(self, slot):
+        self.counts[slot] = 0
+        self.sums[slot] = [0.0] * self.channels
+        self.mins[slot] = [math.inf] * self.channels
+        self.maxs[slot] = [-math.inf] * self.channels
+
+    def advance(self, timestamp):
+        # 시각을 timestamp 로 옮기면서 구간을 벗어난 칸들을 비움
+        bucket = int(timestamp // self.width)
+        if self.current is None:
+            self.current = bucket
+            return
+        if bucket <= self.current:
+            return
+        expired = min(bucket - self.current, self.buckets)
+        for step in range(1, expired + 1):
+            self._clear((self.current + step) % self.buckets)
+        self.current = bucket
+        # 빼기를 반복하면 부동소수점 오차가 쌓이므로 칸이 바뀔 때 합계를 다시 계산
+        self.total_count = sum(self.counts)
+        self.total_sums = [sum(column) for column in zip(*self.sums)]
+
+    def add(self, timestamp, values):
+        self.advance(timestamp)
+        bucket = int(timestamp // self.width)
+        if self.current - bucket >= self.buckets:
+            return  # 구간보다 오래된 늦은 측정값은 버림
+        slot = bucket % self.buckets
+        self.counts[slot] += 1
+        self.total_count += 1
+        sums, mins, maxs = self.sums[slot], self.mins[slot], self.maxs[slot]
+        for channel, value in enumerate(values):
+            sums[channel] += value
+            self.total_sums[channel] += value
+            if value < mins[channel]:
+                mins[channel] = value
+            if value > maxs[channel]:
+                maxs[channel] = value
+
+    def mean(self):
+        if not self.total_count:
+            return [math.nan] * self.channels
+        return [total / self.total_count for total in self.total_sums]
+
+    def minimum(self):
+        return [min(column) for column in zip(*self.mins)]
+
+    def maximum(self):
+        return [max(column) for column in zip(*self.maxs)]
+
+
+class RollingStats:
+    """여러 구간(1분/5분/1시간 등)의 RollingWindow 를 동시에 유지한다."""
+
+    def __init__(self, windows=None, buckets=DEFAULT_BUCKETS, channels=CHANNELS):
+        self.channels = channels
+        self.windows = {
+            name: RollingWindow(seconds, buckets, len(channels))
+            for name, seconds in (windows or DEFAULT_WINDOWS).items()
+        }
+
+    def add(self, timestamp, env_values):
+        values = [env_values[name] for name in self.channels]
+        for window in self.windows.values():
+            window.add(timestamp, values)
+
+    def summary(self, window_name, now=None):
+        """
+        구간 하나의 채널별 {'mean', 'min', 'max', 'count'} 를 반환.
+        now 를 주면 그 시각 기준으로 오래된 칸을 먼저 비운다.
+        """
+        window = self.windows[window_name]
+        if now is not None:
+            window.advance(now)
+        means, mins, maxs = window.mean(), window.minimum(), window.maximum()
+        result = {}
+        for channel, name in enumerate(self.channels):
+            empty = not window.total_count
+            result[name] = {
+                'mean': None if empty else round(means[channel], 4),
+                'min': None if empty else mins[channel],
+                'max': None if empty else maxs[channel]
+            }
+        return result
+
+    def averages(self, window_name, now=None):
+        # print_average 용: 채널별 평균만
+        return {name: stats['mean'] for name, stats in self.summary(window_name, now).items()}
@@ -0,0 +1,449 @@
+import argparse
+import os
+import struct
+import time
+from datetime import datetime
+
+import numpy as np
+
+from sensor_binlog import BinarySensorLog, SensorLogReader, TIME_FORMAT, parse_text_line
+from sensor_channels import CHANNELS
+
+MAGIC = b'MROLLUP1'
+VERSION = 1
+
+# 해상도 단계: (이름, 집계 간격 초, 세그먼트 파일 하나가 담는 기간 초, 보관 기간 초)
+# raw 는 측정값 그대로, 보관 기간 None 은 지우지 않음
+TIERS = (
+    ('raw', 0, 3600, 2 * 86400),
+    ('1min', 60, 86400, 14 * 86400),
+    ('5min', 300, 7 * 86400, 90 * 86400),
+    ('1hour', 3600, 30 * 86400, None),
+)
+
+# 간격을 정하지 않은 조회는 결과가 이 개수 안팎이 되도록 간격을 고름
+MAX_POINTS = 1000
+
+# 집계 레코드: 구간 시작 + 개수 + 채널별 합/최소/최대 (112바이트)
+ROLLUP_DTYPE = np.dtype([
+    ('start', '<i8'),
+    ('count', '<i8'),
+    ('sum', '<f8', (len(CHANNELS),)),
+    ('min', '<f4', (len(CHANNELS),)),
+    ('max', '<f4', (len(CHANNELS),)),
+])
+HEADER_FORMAT = '<8sIIq'
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+
+
+class Bucket:
+    # 아직 닫히지 않은 집계 구간 하나
+    __slots__ = ('start', 'count', 'sums', 'mins', 'maxs')
+
+    def __init__(self, start):
+        self.start = start
+        self.count = 0
+        self.sums = np.zeros(len(CHANNELS))
+        self.mins = np.full(len(CHANNELS), np.inf)
+        self.maxs = np.full(len(CHANNELS), -np.inf)
+
+    def add(self, count, sums, mins, maxs):
+        self.count += count
+        self.sums += sums
+        np.minimum(self.mins, mins, out=self.mins)
+        np.maximum(self.maxs, maxs, out=self.maxs)
+
+    def values(self):
+        return self.start, self.count, self.sums, self.mins, self.maxs
+
+    def record(self):
+        return np.array([(self.start, self.count, self.sums, self.mins, self.maxs)], dtype=ROLLUP_DTYPE)
+
+
+class RollupTier:
+    """
+    집계 단계 하나 (1min/5min/1hour).
+    구간이 닫힐 때마다 레코드 하나를 현재 세그먼트 파일에 덧붙이고,
+    새 세그먼트로 넘어갈 때 보관 기간이 지난 세그먼트 파일을 지운다.
+    """
+
+    def __init__(self, root, name, resolution, segment, retention):
+        self.name = name
+        self.resolution = resolution
+        self.segment = segment
+        self.retention = retention
+        self.directory = os.path.join(root, name)
+        os.makedirs(self.directory, exist_ok=True)
+        self.bucket = None
+        self.file = None
+        self.file_start = None
+
+    def _open(self, start):
+        segment_start = start - start % self.segment
+        if segment_start == self.file_start:
+            return
+        if self.file:
+            self.file.close()
+        path = os.path.join(self.directory, f'{segment_start}.bin')
+        self.file = open(path, 'ab')
+        if self.file.tell() == 0:
+            self.file.write(struct.pack(HEADER_FORMAT, MAGIC, VERSION, ROLLUP_DTYPE.itemsize, self.resolution))
+        self.file_start = segment_start
+        expire_segments(self.directory, self.segment, self.retention, segment_start)
+
+    def write(self, bucket):
+        self._open(bucket.start)
+        self.file.write(bucket.record().tobytes())
+
+    def add(self, start, count, sums, mins, maxs):
+        """
+        아래 단계에서 닫힌 구간(또는 측정값 하나)을 반영한다.
+        이 단계의 구간이 바뀌면 닫힌 구간을 돌려줘서 윗단계로 넘긴다.
+        """
+        start = start - start % self.resolution
+        closed = None
+        if self.bucket is None:
+            self.bucket = Bucket(start)
+        elif start > self.bucket.start:
+            closed = self.bucket
+            self.write(closed)
+            self.bucket = Bucket(start)
+        elif start < self.bucket.start:
+            # 늦게 도착한 값은 따로 레코드로 남김 (조회할 때 같은 구간끼리 합쳐짐)
+            late = Bucket(start)
+            late.add(count, sums, mins, maxs)
+            self.write(late)
+            return late
+        self.bucket.add(count, sums, mins, maxs)
+        return closed
+
+    def flush(self):
+        if self.file:
+            self.file.flush()
+
+    def close(self):
+        # 열려 있는 구간도 기록 (다시 시작하면 같은 구간 레코드가 하나 더 생기지만 조회 시 합쳐짐)
+        if self.bucket is not None and self.bucket.count:
+            self.write(self.bucket)
+            self.bucket = None
+        if self.file:
+            self.file.close()
+            self.file = None
+            self.file_start = None
+
+    def read(self, start, end):
+        # start <= 구간 시작 < end 인 레코드 (열려 있는 구간 포함)
+        parts = [
+            read_rollup_file(path)
+            for path in segment_paths(self.directory, self.segment, start, end)
+        ]
+        if self.bucket is not None and self.bucket.count:
+            parts.append(self.bucket.record())
+        if not parts:
+            return np.empty(0, dtype=ROLLUP_DTYPE)
+        records = np.concatenate(parts)
+        return records[(records['start'] >= start - start % self.resolution) & (records['start'] < end)]
+
+    def newest(self):
+        # 디스크에 기록된 가장 최근 구간의 시작 시각 (없으면 None)
+        for _, path in reversed(list_segments(self.directory)):
+            records = read_rollup_file(path)
+            if len(records):
+                return int(records['start'].max())
+        return None
+
+
+class RawTier:
+    """측정값을 그대로 32바이트 레코드(sensor_binlog 형식)로 세그먼트 파일에 쓰는 단계"""
+
+    def __init__(self, root, name, resolution, segment, retention):
+        self.name = name
+        self.resolution = resolution
+        self.segment = segment
+        self.retention = retention
+        self.directory = os.path.join(root, name)
+        os.makedirs(self.directory, exist_ok=True)
+        self.log = None
+        self.file_start = None
+
+    def add(self, timestamp, env_values):
+        start = int(timestamp)
+        segment_start = start - start % self.segment
+        if segment_start != self.file_start:
+            if self.log:
+                self.log.close()
+            self.log = BinarySensorLog(os.path.join(self.directory, f'{segment_start}.bin'))
+            self.file_start = segment_start
+            expire_segments(self.directory, self.segment, self.retention, segment_start)
+        self.log.append(timestamp, env_values)
+
+    def flush(self):
+        if self.log:
+            self.log.flush()
+
+    def close(self):
+        if self.log:
+            self.log.close()
+            self.log = None
+            self.file_start = None
+
+    def read(self, start, end):
+        # 측정값 하나를 개수 1 인 집계 레코드로 바꿔서 돌려줌
+        parts = []
+        for path in segment_paths(self.directory, self.segment, start, end):
+            with SensorLogReader(path) as reader:
+                raw = np.array(reader.time_range(start, end - 1))
+            values = np.column_stack([raw[name] for name in CHANNELS]) if len(raw) else np.empty((0, len(CHANNELS)))
+            records = np.empty(len(raw), dtype=ROLLUP_DTYPE)
+            records['start'] = raw['timestamp']
+            records['count'] = 1
+            records['sum'] = values
+            records['min'] = values
+            records['max'] = values
+            parts.append(records)
+        if not parts:
+            return np.empty(0, dtype=ROLLUP_DTYPE)
+        return np.concatenate(parts)
+
+    def newest(self):
+        # 디스크에 기록된 가장 최근 측정 시각 (없으면 None)
+        for _, path in reversed(list_segments(self.directory)):
+            with SensorLogReader(path) as reader:
+                if len(reader):
+                    return float(reader.column('timestamp').max())
+        return None
+
+
+def read_rollup_file(path):
+    with open(path, 'rb') as f:
+        header = f.read(HEADER_SIZE)
+        if len(header) < HEADER_SIZE:
+            return np.empty(0, dtype=ROLLUP_DTYPE)
+        magic, version, record_size, resolution = struct.unpack(HEADER_FORMAT, header)
+        if magic != MAGIC or record_size != ROLLUP_DTYPE.itemsize:
+            raise ValueError(f'집계 파일이 아닙니다: {path}')
+        data = f.read()
+    # 쓰는 중이라 끝에 덜 써진 레코드가 있으면 제외
+    count = len(data) // ROLLUP_DTYPE.itemsize
+    return np.frombuffer(data, dtype=ROLLUP_DTYPE, count=count)
+
+
+def list_segments(directory):
+    # (세그먼트 시작 시각, 경로) 를 시간순으로
+    segments = []
+    for file_name in os.listdir(directory):
+        stem, ext = os.path.splitext(file_name)
+        if ext == '.bin' and stem.lstrip('-').isdigit():
+            segments.append((int(stem), os.path.join(directory, file_name)))
+    return sorted(segments)
+
+
+def segment_paths(directory, segment, start, end):
+    # 조회 구간과 겹치는 세그먼트 파일만 (파일 이름이 시작 시각이라 열어 보지 않고 고름)
+    return [path for segment_start, path in list_segments(directory)
+            if segment_start < end and segment_start + segment > start]
+
+
+def expire_segments(directory, segment, retention, now):
+    if retention is None:
+        return
+    for segment_start, path in list_segments(directory):
+        if segment_start + segment <= now - retention:
+            os.remove(path)
+
+
+def aggregate(records, step):
+    """집계 레코드를 step 초 간격으로 다시 묶는다. (같은 구간의 중복 레코드도 여기서 합쳐짐)"""
+    if not len(records):
+        return records
+    keys = records['start'] - records['start'] % step
+    order = np.argsort(keys, kind='stable')
+    keys = keys[order]
+    records = records[order]
+    starts, index = np.unique(keys, return_index=True)
+    result = np.empty(len(starts), dtype=ROLLUP_DTYPE)
+    result['start'] = starts
+    result['count'] = np.add.reduceat(records['count'], index)
+    result['sum'] = np.add.reduceat(records['sum'], index, axis=0)
+    result['min'] = np.minimum.reduceat(records['min'], index, axis=0)
+    result['max'] = np.maximum.reduceat(records['max'], index, axis=0)
+    return result
+
+
+class RollupStore:
+    """
+    센서 기록을 여러 해상도(raw → 1분 → 5분 → 1시간)로 디스크에 쌓는 저장소.
+    - add(): 측정값을 raw 에 쓰고 1분 구간에 반영, 닫힌 구간은 윗단계로 차례로 넘김
+    - 단계마다 세그먼트 파일 단위로 보관 기간이 지나면 삭제
+    - query(): 요청한 간격을 만족하는 가장 거친 단계 하나만 읽음
+      (몇 달치 조회도 1시간 단계 파일 몇 개만 열게 됨)
+    """
+
+    def __init__(self, root, tiers=TIERS):
+        self.root = root
+        self.latest = None   # 가장 최근 측정 시각 (보관 기간 판단용)
+        self.raw = None
+        self.rollups = []
+        for name, resolution, segment, retention in tiers:
+            if resolution:
+                self.rollups.append(RollupTier(root, name, resolution, segment, retention))
+            else:
+                self.raw = RawTier(root, name, resolution, segment, retention)
+        # 다시 열었을 때도 현재 시각이 아니라 디스크에 남은 가장 최근 기록을 기준으로 함
+        # (각 단계의 마지막 세그먼트만 읽음. raw 가 있으면 측정 시각 그대로, 없으면 구간 시작 시각)
+        newest = [value for value in (tier.newest() for tier in self.tiers()) if value is not None]
+        if newest:
+            self.latest = max(newest)
+
+    def tiers(self):
+        return ([self.raw] if self.raw else []) + self.rollups
+
+    def add(self, timestamp, env_values):
+        if self.latest is None or timestamp > self.latest:
+            self.latest = timestamp
+        if self.raw:
+            self.raw.add(timestamp, env_values)
+        values = np.array([env_values[name] for name in CHANNELS], dtype=np.float64)
+        closed = (int(timestamp), 1, values, values, values)
+        for tier in self.rollups:
+            bucket = tier.add(*closed)
+            if bucket is None:
+                break
+            closed = bucket.values()
+
+    def choose_tier(self, step, start=None):
+        """
+        간격 step 을 만들 수 있는 (해상도가 step 이하인) 가장 거친 단계.
+        start 가 그 단계의 보관 기간 밖이면 start 까지 남아 있는 가장 고운 단계로 대신한다.
+        """
+        tiers = self.tiers()
+        if start is not None:
+            latest = time.time() if self.latest is None else self.latest
+            kept = [tier for tier in tiers
+                    if tier.retention is None or start >= latest - tier.retention]
+            tiers = kept or tiers[-1:]
+        candidates = [tier for tier in tiers if tier.resolution <= step]
+        if not candidates:
+            return tiers[0]
+        return max(candidates, key=lambda tier: tier.resolution)
+
+    def query(self, start, end, step=None):
+        """
+        start <= 시각 < end 구간을 step 초 간격으로 묶은 채널별 평균/최소/최대.
+        반환: {'tier': 읽은 단계, 'step': 간격, 'buckets': [{'start', 'count', 'channels'}, ...]}
+        """
+        if step is None:
+            step = max(1, int((end - start) // MAX_POINTS))
+        tier = self.choose_tier(step, start)
+        # 간격은 단계 해상도의 배수로 맞춤
+        if tier.resolution:
+            step = max(tier.resolution, step - step % tier.resolution)
+        tier.flush()
+        records = tier.read(int(start), int(end))
+        # 아직 윗단계로 넘어가지 않은 아래 단계의 열린 구간도 더해서 최근 값이 빠지지 않게 함
+        if tier in self.rollups:
+            pending = [lower.bucket.record() for lower in self.rollups[:self.rollups.index(tier)]
+                       if lower.bucket is not None and lower.bucket.count
+                       and start <= lower.bucket.start < end]
+            records = np.concatenate([records] + pending)
+        records = aggregate(records, int(step))
+
+        buckets = []
+        for record in records:
+            count = int(record['count'])
+            buckets.append({
+                'start': int(record['start']),
+                'count': count,
+                'channels': {
+                    name: {
+                        'mean': round(float(record['sum'][channel]) / count, 4),
+                        'min': round(float(record['min'][channel]), 4),
+                        'max': round(float(record['max'][channel]), 4)
+                    }
+                    for channel, name in enumerate(CHANNELS)
+                }
+            })
+        return {'tier': tier.name, 'step': int(step), 'buckets': buckets}
+
+    def flush(self):
+        for tier in self.tiers():
+            tier.flush()
+
+    def close(self):
+        # 아직 닫히지 않은 구간도 윗단계에 반영한 뒤 기록 (거친 단계에 마지막 몇 분이 빠지지 않게)
+        if self.raw:
+            self.raw.close()
+        carry = []
+        for tier in self.rollups:
+            pending = [bucket for bucket in (tier.add(*values) for values in carry) if bucket]
+            if tier.bucket is not None and tier.bucket.count:
+                pending.append(tier.bucket)
+            carry = [bucket.values() for bucket in pending]
+            tier.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def import_text_log(store, text_path):
+    # 기존 sensor_log.txt 를 저장소에 채워 넣음 (잘못된 줄은 건너뜀)
+    imported = 0
+    skipped = 0
+    with open(text_path, 'r', encoding='utf-8') as source:
+        for line in source:
+            parsed = parse_text_line(line)
+            if parsed is None:
+                skipped += 1
+                continue
+            store.add(*parsed)
+            imported += 1
+    return imported, skipped
+
+
+def main():
+    parser = argparse.ArgumentParser(description='센서 기록 다중 해상도 저장소')
+    parser.add_argument('store', help='저장소 폴더')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    load = sub.add_parser('import', help='텍스트 센서 로그 가져오기')
+    load.add_argument('text_log')
+
+    query = sub.add_parser('query', help='구간 조회')
+    query.add_argument('--start', required=True, help="시작 시각 (예: '2025-04-02 13:00:00')")
+    query.add_argument('--end', required=True, help='끝 시각')
+    query.add_argument('--step', type=int, help='묶을 간격 (초), 생략하면 자동')
+    query.add_argument('--channel', choices=CHANNELS, help='출력할 채널 (생략하면 전체 평균)')
+
+    args = parser.parse_args()
+
+    try:
+        with RollupStore(args.store) as store:
+            if args.command == 'import':
+                imported, skipped = import_text_log(store, args.text_log)
+                print(f'가져오기 완료: {imported}건 (건너뜀 {skipped}건)')
+                return
+
+            start = datetime.strptime(args.start, TIME_FORMAT).timestamp()
+            end = datetime.strptime(args.end, TIME_FORMAT).timestamp()
+            result = store.query(start, end, args.step)
+            print(f"[{result['tier']} 단계, {result['step']}초 간격, {len(result['buckets'])}개 구간]")
+            for bucket in result['buckets']:
+                when = datetime.fromtimestamp(bucket['start']).strftime(TIME_FORMAT)
+                if args.channel:
+                    stats = bucket['channels'][args.channel]
+                    print(f"{when}, {bucket['count']}건, 평균 {stats['mean']}, 최소 {stats['min']}, 최대 {stats['max']}")
+                else:
+                    means = ', '.join(f"{stats['mean']:g}" for stats in bucket['channels'].values())
+                    print(f"{when}, {bucket['count']}건, {means}")
+
+    except FileNotFoundError as e:
+        print(f'파일을 찾을 수 없습니다: {e.filename}')
+    except ValueError as e:
+        print(f'오류 발생: {e}')
+
+
+if __name__ == '__main__':
+    main()
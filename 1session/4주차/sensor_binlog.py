@@ -0,0 +1,180 @@
+import argparse
+import mmap
+import re
+import struct
+from datetime import datetime
+
+import numpy as np
+
+from sensor_channels import CHANNELS
+
+MAGIC = b'MSENSLOG'
+VERSION = 1
+
+# 파일 헤더도 레코드와 같은 32바이트로 맞춰서 레코드 정렬을 유지
+HEADER_FORMAT = '<8sII16x'
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+
+# 레코드: int64 epoch 초 + float32 x 6 = 32바이트
+RECORD_FORMAT = '<q6f'
+RECORD_SIZE = struct.calcsize(RECORD_FORMAT)
+RECORD_DTYPE = np.dtype([('timestamp', '<i8')] + [(name, '<f4') for name in CHANNELS])
+
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# 텍스트 로그 한 줄에서 숫자만 뽑기 (단위 °C, %, W/m² 는 무시)
+NUMBER = re.compile(r'-?\d+(?:\.\d+)?')
+
+
+class BinarySensorLog:
+    """센서 값을 32바이트 고정 폭 레코드로 덧붙여 쓰는 로그"""
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, 'ab')
+        if self.file.tell() == 0:
+            self.file.write(struct.pack(HEADER_FORMAT, MAGIC, VERSION, RECORD_SIZE))
+
+    def append(self, timestamp, env_values):
+        self.file.write(struct.pack(
+            RECORD_FORMAT, int(timestamp), *(env_values[name] for name in CHANNELS)
+        ))
+
+    def flush(self):
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class SensorLogReader:
+    """
+    바이너리 센서 로그를 메모리 맵으로 읽는다.
+    - column(name): 복사 없는 열 뷰
+    - time_range(start, end): 시각 열을 이진 탐색해서 구간 레코드만 잘라 냄
+    (레코드가 시간순으로 쌓였다고 가정)
+    """
+
+    def __init__(self, path):
+        self.file = open(path, 'rb')
+        self.mm = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, record_size = struct.unpack_from(HEADER_FORMAT, self.mm, 0)
+        if magic != MAGIC or record_size != RECORD_SIZE:
+            self.close()
+            raise ValueError(f'센서 바이너리 로그가 아닙니다: {path}')
+        self.version = version
+        # 쓰는 중이라 끝에 덜 써진 레코드가 있으면 제외
+        count = (len(self.mm) - HEADER_SIZE) // RECORD_SIZE
+        self.records = np.frombuffer(self.mm, dtype=RECORD_DTYPE, count=count, offset=HEADER_SIZE)
+
+    def __len__(self):
+        return len(self.records)
+
+    def column(self, name):
+        return self.records[name]
+
+    def time_range(self, start=None, end=None):
+        # start <= timestamp <= end 인 레코드 (복사 없는 슬라이스)
+        timestamps = self.records['timestamp']
+        lo = 0 if start is None else np.searchsorted(timestamps, start, side='left')
+        hi = len(timestamps) if end is None else np.searchsorted(timestamps, end, side='right')
+        return self.records[lo:hi]
+
+    def env_values(self, index):
+        record = self.records[index]
+        return {name: round(float(record[name]), 4) for name in CHANNELS}
+
+    def close(self):
+        # numpy 뷰가 mmap 을 붙잡고 있으면 닫을 수 없으므로 먼저 해제
+        self.records = None
+        self.mm.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def parse_text_line(line):
+    """
+    '2025-04-02 13:51:13, 30°C, 1°C, 52%, 638.97 W/m², 0.0589%, 5.14%'
+    → (epoch, env_values). 형식이 다르면 None
+    """
+    parts = line.strip().split(',', 1)
+    if len(parts) != 2:
+        return None
+    try:
+        timestamp = datetime.strptime(parts[0], TIME_FORMAT).timestamp()
+    except ValueError:
+        return None
+    numbers = NUMBER.findall(parts[1])
+    if len(numbers) != len(CHANNELS):
+        return None
+    return timestamp, {name: float(value) for name, value in zip(CHANNELS, numbers)}
+
+
+def convert_text_log(text_path, binary_path):
+    # 기존 sensor_log.txt → 바이너리 로그 (잘못된 줄은 건너뜀)
+    converted = 0
+    skipped = 0
+    with open(text_path, 'r', encoding='utf-8') as source, BinarySensorLog(binary_path) as target:
+        for line in source:
+            parsed = parse_text_line(line)
+            if parsed is None:
+                skipped += 1
+                continue
+            target.append(*parsed)
+            converted += 1
+    return converted, skipped
+
+
+def print_records(records):
+    # 함수 안에서만 뷰를 잡고 있어야 reader 를 닫을 수 있음
+    for record in records:
+        now = datetime.fromtimestamp(int(record['timestamp'])).strftime(TIME_FORMAT)
+        values = ', '.join(f'{float(record[name]):g}' for name in CHANNELS)
+        print(f'{now}, {values}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='센서 로그 바이너리 변환/조회')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    convert = sub.add_parser('convert', help='텍스트 로그를 바이너리로 변환')
+    convert.add_argument('text_log')
+    convert.add_argument('binary_log')
+
+    show = sub.add_parser('show', help='바이너리 로그 조회')
+    show.add_argument('binary_log')
+    show.add_argument('--start', help="시작 시각 (예: '2025-04-02 13:00:00')")
+    show.add_argument('--end', help="끝 시각")
+
+    args = parser.parse_args()
+
+    try:
+        if args.command == 'convert':
+            converted, skipped = convert_text_log(args.text_log, args.binary_log)
+            print(f'변환 완료: {converted}건 (건너뜀 {skipped}건)')
+            return
+
+        start = datetime.strptime(args.start, TIME_FORMAT).timestamp() if args.start else None
+        end = datetime.strptime(args.end, TIME_FORMAT).timestamp() if args.end else None
+        with SensorLogReader(args.binary_log) as reader:
+            print_records(reader.time_range(start, end))
+
+    except FileNotFoundError as e:
+        print(f'파일을 찾을 수 없습니다: {e.filename}')
+    except ValueError as e:
+        print(f'오류 발생: {e}')
+
+
+if __name__ == '__main__':
+    main()
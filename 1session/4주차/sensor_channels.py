@@ -0,0 +1,19 @@
+# DummySensor 의 env_values 항목 순서 (배열/바이너리 형식에서 열 순서로 사용)
+CHANNELS = (
+    'mars_base_internal_temperature',     # 화성 기지 내부 온도
+    'mars_base_external_temperature',     # 화성 기지 외부 온도
+    'mars_base_internal_humidity',        # 화성 기지 내부 습도
+    'mars_base_external_illuminance',     # 화성 기지 외부 광량
+    'mars_base_internal_co2',             # 화성 기지 내부 이산화탄소 농도
+    'mars_base_internal_oxygen'           # 화성 기지 내부 산소 농도
+)
+
+# DummySensor.set_env 와 같은 값 범위: (최소, 최대, 소수 자릿수) / 자릿수 None 은 정수
+RANGES = {
+    'mars_base_internal_temperature': (18, 30, None),
+    'mars_base_external_temperature': (0, 21, None),
+    'mars_base_internal_humidity': (50, 60, None),
+    'mars_base_external_illuminance': (500, 715, 2),
+    'mars_base_internal_co2': (0.02, 0.1, 4),
+    'mars_base_internal_oxygen': (4.0, 7.0, 2)
+}
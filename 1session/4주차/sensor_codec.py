@@ -0,0 +1,360 @@
+import argparse
+import atexit
+import os
+import struct
+import threading
+import time
+
+from sensor_channels import CHANNELS
+
+MAGIC = b'MSENSGZ2'
+
+# 블록 하나에 담을 샘플 수
+BLOCK_SAMPLES = 1024
+
+# 열린 블록을 이 시간(초)이 지나면 짧은 블록으로라도 기록 (비정상 종료 시 잃는 양의 상한)
+MAX_DELAY = 300.0
+
+# 블록 헤더: 첫 시각(복원 기준), 최소 시각, 최대 시각, 샘플 수, 본문 길이
+# (시각이 거꾸로 가는 샘플이 있어도 블록 건너뛰기가 맞도록 최소/최대를 따로 기록)
+BLOCK_HEADER_FORMAT = '<qqqII'
+BLOCK_HEADER_SIZE = struct.calcsize(BLOCK_HEADER_FORMAT)
+
+# 시각 delta-of-delta 구간: (접두 비트, 접두 길이, 값 비트 수)
+DOD_BUCKETS = (
+    (0b10, 2, 7),
+    (0b110, 3, 9),
+    (0b1110, 4, 12),
+)
+DOD_FALLBACK = (0b1111, 4, 32)
+
+
+def float_to_bits(value):
+    return struct.unpack('<Q', struct.pack('<d', value))[0]
+
+
+def bits_to_float(bits):
+    return struct.unpack('<d', struct.pack('<Q', bits))[0]
+
+
+class BitWriter:
+    def __init__(self):
+        self.data = bytearray()
+        self.acc = 0
+        self.acc_bits = 0
+
+    def write(self, value, bits):
+        self.acc = (self.acc << bits) | (value & ((1 << bits) - 1))
+        self.acc_bits += bits
+        while self.acc_bits >= 8:
+            self.acc_bits -= 8
+            self.data.append((self.acc >> self.acc_bits) & 0xFF)
+        self.acc &= (1 << self.acc_bits) - 1
+
+    def getvalue(self):
+        if self.acc_bits:
+            return bytes(self.data) + bytes([(self.acc << (8 - self.acc_bits)) & 0xFF])
+        return bytes(self.data)
+
+
+class BitReader:
+    def __init__(self, data):
+        self.data = data
+        self.index = 0
+        self.acc = 0
+        self.acc_bits = 0
+
+    def read(self, bits):
+        while self.acc_bits < bits:
+            self.acc = (self.acc << 8) | self.data[self.index]
+            self.index += 1
+            self.acc_bits += 8
+        self.acc_bits -= bits
+        value = self.acc >> self.acc_bits
+        self.acc &= (1 << self.acc_bits) - 1
+        return value
+
+    def read_signed(self, bits):
+        value = self.read(bits)
+        if value >= 1 << (bits - 1):
+            value -= 1 << bits
+        return value
+
+
+class BlockEncoder:
+    """
+    Gorilla 방식으로 한 블록을 압축한다.
+    - 시각: 이전 간격과의 차이(delta-of-delta)를 가변 길이로 기록 (주기가 일정하면 1비트)
+    - 값: 채널마다 이전 값과 XOR 해서 달라진 비트만 기록 (값이 같으면 1비트)
+    """
+
+    def __init__(self):
+        self.writer = BitWriter()
+        self.count = 0
+        self.first_ts = None
+        self.last_ts = None
+        self.min_ts = None
+        self.max_ts = None
+        self.last_delta = 0
+        self.last_bits = [0] * len(CHANNELS)
+        self.windows = [None] * len(CHANNELS)  # 채널별 (앞쪽 0 개수, 뒤쪽 0 개수)
+
+    def _write_timestamp(self, timestamp):
+        delta = timestamp - self.last_ts
+        dod = delta - self.last_delta
+        self.last_delta = delta
+        self.last_ts = timestamp
+        if dod == 0:
+            self.writer.write(0, 1)
+            return
+        for prefix, prefix_bits, bits in DOD_BUCKETS:
+            if -(1 << (bits - 1)) <= dod < (1 << (bits - 1)):
+                self.writer.write(prefix, prefix_bits)
+                self.writer.write(dod, bits)
+                return
+        prefix, prefix_bits, bits = DOD_FALLBACK
+        self.writer.write(prefix, prefix_bits)
+        self.writer.write(dod, bits)
+
+    def _write_value(self, channel, value):
+        bits = float_to_bits(value)
+        xor = bits ^ self.last_bits[channel]
+        self.last_bits[channel] = bits
+        if xor == 0:
+            self.writer.write(0, 1)
+            return
+        self.writer.write(1, 1)
+        leading = min(64 - xor.bit_length(), 31)
+        trailing = (xor & -xor).bit_length() - 1
+        window = self.windows[channel]
+        if window and leading >= window[0] and trailing >= window[1]:
+            # 이전 구간 안에 들어가면 구간 정보 없이 값만
+            self.writer.write(0, 1)
+            meaningful = 64 - window[0] - window[1]
+            self.writer.write(xor >> window[1], meaningful)
+            return
+        meaningful = 64 - leading - trailing
+        self.writer.write(1, 1)
+        self.writer.write(leading, 5)
+        self.writer.write(meaningful & 0x3F, 6)  # 64 는 0 으로 기록
+        self.writer.write(xor >> trailing, meaningful)
+        self.windows[channel] = (leading, trailing)
+
+    def append(self, timestamp, values):
+        timestamp = int(timestamp)
+        if self.count == 0:
+            # 첫 샘플: 시각은 블록 헤더에, 값은 64비트 그대로
+            self.first_ts = self.last_ts = self.min_ts = self.max_ts = timestamp
+            for channel, value in enumerate(values):
+                bits = float_to_bits(value)
+                self.writer.write(bits, 64)
+                self.last_bits[channel] = bits
+        else:
+            self._write_timestamp(timestamp)
+            self.min_ts = min(self.min_ts, timestamp)
+            self.max_ts = max(self.max_ts, timestamp)
+            for channel, value in enumerate(values):
+                self._write_value(channel, value)
+        self.count += 1
+
+    def to_bytes(self):
+        payload = self.writer.getvalue()
+        header = struct.pack(BLOCK_HEADER_FORMAT, self.first_ts, self.min_ts, self.max_ts, self.count, len(payload))
+        return header + payload
+
+
+def decode_block(first_ts, count, payload):
+    # 블록 본문 → [(timestamp, [값 6개]), ...]
+    reader = BitReader(payload)
+    channels = len(CHANNELS)
+    last_bits = [reader.read(64) for _ in range(channels)]
+    windows = [None] * channels
+    timestamp = first_ts
+    delta = 0
+    samples = [(timestamp, [bits_to_float(bits) for bits in last_bits])]
+
+    for _ in range(count - 1):
+        if reader.read(1) == 0:
+            dod = 0
+        else:
+            dod = None
+            for _, prefix_bits, bits in DOD_BUCKETS:
+                if reader.read(1) == 0:
+                    dod = reader.read_signed(bits)
+                    break
+            if dod is None:
+                dod = reader.read_signed(DOD_FALLBACK[2])
+        delta += dod
+        timestamp += delta
+
+        for channel in range(channels):
+            if reader.read(1) == 0:
+                continue
+            if reader.read(1) == 0:
+                leading, trailing = windows[channel]
+                meaningful = 64 - leading - trailing
+            else:
+                leading = reader.read(5)
+                meaningful = reader.read(6) or 64
+                trailing = 64 - leading - meaningful
+                windows[channel] = (leading, trailing)
+            last_bits[channel] ^= reader.read(meaningful) << trailing
+        samples.append((timestamp, [bits_to_float(bits) for bits in last_bits]))
+    return samples
+
+
+class CompressedSensorLog:
+    """
+    센서 값을 블록 단위로 압축해서 덧붙이는 스트리밍 인코더.
+    BinarySensorLog 와 같은 append(timestamp, env_values) 를 제공하므로
+    DummySensor(binary_log=CompressedSensorLog(...)) 로 바로 쓸 수 있다.
+    - 블록이 block_samples 개로 차거나, 열린 지 max_delay 초가 지나면 기록
+      (시간 기준 기록은 백그라운드 스레드가 함, max_delay 가 None 이면 끔)
+    - 프로그램이 끝날 때 열린 블록을 잃지 않도록 atexit 로 close() 를 등록
+    """
+
+    def __init__(self, path, block_samples=BLOCK_SAMPLES, max_delay=MAX_DELAY):
+        self.file = open(path, 'ab')
+        if self.file.tell() == 0:
+            self.file.write(MAGIC)
+        else:
+            with open(path, 'rb') as f:
+                magic = f.read(len(MAGIC))
+            if magic != MAGIC:
+                self.file.close()
+                raise ValueError(f'다른 형식의 압축 센서 로그에는 이어 쓸 수 없습니다: {path}')
+        self.block_samples = block_samples
+        self.max_delay = max_delay
+        self.block = BlockEncoder()
+        self.block_started = None
+        self.closed = False
+        self.condition = threading.Condition()
+
+        self.flusher = None
+        if max_delay is not None:
+            self.flusher = threading.Thread(target=self._run, daemon=True)
+            self.flusher.start()
+        atexit.register(self.close)
+
+    def append(self, timestamp, env_values):
+        values = [float(env_values[name]) for name in CHANNELS]
+        with self.condition:
+            if self.closed:
+                raise ValueError('닫힌 로그 파일입니다.')
+            if not self.block.count:
+                self.block_started = time.monotonic()
+                self.condition.notify()
+            self.block.append(timestamp, values)
+            if self.block.count >= self.block_samples:
+                self._write_block()
+
+    def _write_block(self):
+        # condition 을 잡은 상태에서 호출. 모인 샘플을 블록 하나로 기록 (블록이 짧아질 뿐 데이터는 그대로)
+        if self.block.count:
+            self.file.write(self.block.to_bytes())
+            self.file.flush()
+            self.block = BlockEncoder()
+            self.block_started = None
+
+    def _run(self):
+        with self.condition:
+            while not self.closed:
+                if self.block_started is None:
+                    self.condition.wait()
+                    continue
+                remaining = self.block_started + self.max_delay - time.monotonic()
+                if remaining <= 0:
+                    self._write_block()
+                else:
+                    self.condition.wait(remaining)
+
+    def flush(self):
+        with self.condition:
+            self._write_block()
+            self.file.flush()
+
+    def close(self):
+        with self.condition:
+            if self.closed:
+                return
+            self.closed = True
+            self.condition.notify()
+        if self.flusher is not None:
+            self.flusher.join()
+        with self.condition:
+            self._write_block()
+            self.file.close()
+        atexit.unregister(self.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class CompressedSensorReader:
+    """블록 헤더의 시각 범위(최소/최대)를 보고 필요 없는 블록은 본문을 읽지 않고 건너뛴다."""
+
+    def __init__(self, path):
+        self.path = path
+        self.blocks_read = 0
+        self.blocks_skipped = 0
+
+    def _read_header(self, f):
+        # (첫 시각, 최소 시각, 최대 시각, 샘플 수, 본문 길이), 파일 끝이면 None
+        header = f.read(BLOCK_HEADER_SIZE)
+        if len(header) < BLOCK_HEADER_SIZE:
+            return None
+        return struct.unpack(BLOCK_HEADER_FORMAT, header)
+
+    def read(self, start=None, end=None):
+        # start <= timestamp <= end 인 (timestamp, env_values) 를 차례로 반환
+        with open(self.path, 'rb') as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f'압축 센서 로그가 아닙니다: {self.path}')
+            while True:
+                header = self._read_header(f)
+                if header is None:
+                    return
+                first_ts, min_ts, max_ts, count, size = header
+                if (start is not None and max_ts < start) or (end is not None and min_ts > end):
+                    f.seek(size, os.SEEK_CUR)
+                    self.blocks_skipped += 1
+                    continue
+                payload = f.read(size)
+                if len(payload) < size:
+                    return  # 쓰는 중이라 덜 기록된 블록
+                self.blocks_read += 1
+                for timestamp, values in decode_block(first_ts, count, payload):
+                    if (start is None or timestamp >= start) and (end is None or timestamp <= end):
+                        yield timestamp, dict(zip(CHANNELS, values))
+
+
+def main():
+    from sensor_binlog import parse_text_line
+
+    parser = argparse.ArgumentParser(description='센서 로그 압축 (Gorilla 방식)')
+    parser.add_argument('text_log', help='변환할 sensor_log.txt')
+    parser.add_argument('output', help='압축 로그 저장 경로')
+    args = parser.parse_args()
+
+    try:
+        count = 0
+        with open(args.text_log, 'r', encoding='utf-8') as source, CompressedSensorLog(args.output) as target:
+            for line in source:
+                parsed = parse_text_line(line)
+                if parsed:
+                    target.append(*parsed)
+                    count += 1
+        before = os.path.getsize(args.text_log)
+        after = os.path.getsize(args.output)
+        print(f'압축 완료: {count}건, {before} → {after} 바이트 ({before / max(after, 1):.1f}배)')
+    except FileNotFoundError as e:
+        print(f'파일을 찾을 수 없습니다: {e.filename}')
+    except ValueError as e:
+        print(f'오류 발생: {e}')
+
+
+if __name__ == '__main__':
+    main()
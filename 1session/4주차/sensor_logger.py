@@ -0,0 +1,117 @@
+import atexit
+import os
+import threading
+import time
+
+# 내구성 정책
+DURABILITY_NONE = 'none'      # 버퍼를 파일 객체에 쓰기만 함 (OS 에 맡김)
+DURABILITY_FLUSH = 'flush'    # 쓸 때마다 파일 버퍼까지 비움
+DURABILITY_FSYNC = 'fsync'    # fsync_every 번 쓸 때마다 디스크까지 동기화
+
+
+class BufferedLogWriter:
+    """
+    로그 파일을 한 번만 열어 두고 줄들을 메모리 버퍼에 모았다가 한꺼번에 쓴다.
+    - 버퍼가 max_bytes 를 넘거나 max_delay 초가 지나면 비움
+    - 실제 디스크 쓰기는 백그라운드 스레드가 하므로 측정(샘플링) 스레드는 막히지 않음
+    """
+
+    def __init__(self, path, max_bytes=64 * 1024, max_delay=1.0,
+                 durability=DURABILITY_FLUSH, fsync_every=1, encoding='utf-8'):
+        if durability not in (DURABILITY_NONE, DURABILITY_FLUSH, DURABILITY_FSYNC):
+            raise ValueError(f'알 수 없는 내구성 정책입니다: {durability}')
+        self.path = path
+        self.max_bytes = max_bytes
+        self.max_delay = max_delay
+        self.durability = durability
+        self.fsync_every = max(1, fsync_every)
+        self.encoding = encoding
+
+        self.file = open(path, 'a', encoding=encoding)
+        self.buffer = []
+        self.buffered_bytes = 0
+        self.writes = 0
+        self.closed = False
+        self.condition = threading.Condition()
+        # 파일 쓰기 순서를 지키기 위한 잠금 (버퍼 잠금과 분리)
+        self.io_lock = threading.Lock()
+
+        self.flusher = threading.Thread(target=self._run, daemon=True)
+        self.flusher.start()
+        # 프로그램이 끝날 때 남은 버퍼를 잃지 않도록
+        atexit.register(self.close)
+
+    def write(self, line):
+        # 버퍼에 넣기만 하고 바로 돌아감
+        with self.condition:
+            if self.closed:
+                raise ValueError('닫힌 로그 파일입니다.')
+            self.buffer.append(line)
+            self.buffered_bytes += len(line)
+            if self.buffered_bytes >= self.max_bytes:
+                self.condition.notify()
+
+    def _take_buffer(self):
+        lines = self.buffer
+        self.buffer = []
+        self.buffered_bytes = 0
+        return lines
+
+    def _drain(self):
+        # 버퍼를 꺼내서 파일에 씀. 버퍼 잠금은 꺼낼 때만 잡으므로 write() 는 기다리지 않음
+        with self.io_lock:
+            with self.condition:
+                lines = self._take_buffer()
+            self._write_lines(lines)
+
+    def _write_lines(self, lines):
+        if not lines:
+            return
+        self.file.write(''.join(lines))
+        self.writes += 1
+        if self.durability == DURABILITY_FLUSH:
+            self.file.flush()
+        elif self.durability == DURABILITY_FSYNC:
+            self.file.flush()
+            if self.writes % self.fsync_every == 0:
+                os.fsync(self.file.fileno())
+
+    def _run(self):
+        deadline = time.monotonic() + self.max_delay
+        while True:
+            with self.condition:
+                while not self.closed and self.buffered_bytes < self.max_bytes:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self.condition.wait(remaining)
+                if self.closed:
+                    return
+            self._drain()
+            deadline = time.monotonic() + self.max_delay
+
+    def flush(self):
+        # 지금까지 모인 줄을 바로 기록
+        self._drain()
+        with self.io_lock:
+            self.file.flush()
+
+    def close(self):
+        with self.condition:
+            if self.closed:
+                return
+            self.closed = True
+            self.condition.notify()
+        self.flusher.join()
+        self._drain()
+        self.file.flush()
+        if self.durability == DURABILITY_FSYNC:
+            os.fsync(self.file.fileno())
+        self.file.close()
+        atexit.unregister(self.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
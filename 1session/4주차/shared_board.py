@@ -0,0 +1,200 @@
+import argparse
+import os
+import time
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+from sensor_channels import CHANNELS
+
+DEFAULT_NAME = 'mars_env_board'
+
+# 메모리 배치: [uint64 순번][uint64 발행 프로세스 pid][uint64 발행 쪽 tracker 번호][float64 시각][float64 x 채널 수]
+SEQ_OFFSET = 0
+OWNER_OFFSET = 8
+TRACKER_OFFSET = 16
+DATA_OFFSET = 24
+DATA_FIELDS = 1 + len(CHANNELS)
+BOARD_SIZE = DATA_OFFSET + DATA_FIELDS * 8
+
+# 쓰는 중인 값을 만났을 때 다시 읽기를 포기하기까지의 시간 (초)
+READ_TIMEOUT = 1.0
+
+
+def _header(shm, offset):
+    return int(np.ndarray((1,), dtype=np.uint64, buffer=shm.buf, offset=offset)[0])
+
+
+def _tracker_id():
+    """
+    이 프로세스가 쓰는 resource_tracker 파이프의 inode.
+    fork/spawn 된 자식은 부모의 tracker 를 물려받으므로 같은 값이 나옴 (POSIX 외에는 0)
+    """
+    if os.name != 'posix':
+        return 0
+    return os.fstat(resource_tracker.getfd()).st_ino
+
+
+def _untrack(shm):
+    """
+    소유하지 않는 보드를 이 프로세스의 tracker 에서 뺀다 (종료 시 보드가 지워지지 않게).
+    만든 프로세스와 같은 tracker 를 쓰면 등록이 하나로 합쳐져 있어서
+    빼면 만든 쪽의 등록까지 사라지므로 (unlink 때 KeyError) 그대로 둔다.
+    """
+    if os.name != 'posix':
+        return
+    if shm.size >= BOARD_SIZE and _header(shm, TRACKER_OFFSET) == _tracker_id():
+        return
+    resource_tracker.unregister(shm._name, 'shared_memory')
+
+
+def _attach(name):
+    # 읽는 쪽은 공유 메모리를 소유하지 않으므로 추적하지 않고 연다
+    try:
+        shm = shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python 3.12 이하: 열면 등록되므로 직접 뺌
+        shm = shared_memory.SharedMemory(name=name)
+        _untrack(shm)
+    if shm.size < BOARD_SIZE:
+        shm.close()
+        raise ValueError(f'공유 보드 크기가 맞지 않습니다: {name} ({shm.size} < {BOARD_SIZE} 바이트)')
+    return shm
+
+
+def _alive(pid):
+    if os.name == 'nt':
+        # 윈도우는 마지막 핸들이 닫히면 보드가 사라지므로 남아 있으면 사용 중
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+class SharedBoardPublisher:
+    """
+    최신 env_values 를 공유 메모리에 올리는 쪽 (MissionComputer 하나).
+    seqlock 방식: 쓰기 전에 순번을 홀수로, 다 쓴 뒤 짝수로 올린다.
+    """
+
+    def __init__(self, name=DEFAULT_NAME):
+        try:
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=BOARD_SIZE)
+        except FileExistsError:
+            self.shm = self._replace_stale(name)
+        self.name = name
+        self.seq = np.ndarray((1,), dtype=np.uint64, buffer=self.shm.buf, offset=SEQ_OFFSET)
+        self.data = np.ndarray((DATA_FIELDS,), dtype=np.float64, buffer=self.shm.buf, offset=DATA_OFFSET)
+        header = np.ndarray((2,), dtype=np.uint64, buffer=self.shm.buf, offset=OWNER_OFFSET)
+        header[0] = os.getpid()
+        header[1] = _tracker_id()
+
+    @staticmethod
+    def _replace_stale(name):
+        """
+        같은 이름의 보드가 남아 있을 때: 발행 프로세스가 살아 있으면 거부하고,
+        비정상 종료로 남은 보드(또는 크기가 다른 예전 보드)는 지우고 새로 만든다.
+        """
+        old = shared_memory.SharedMemory(name=name)
+        owner = _header(old, OWNER_OFFSET) if old.size >= BOARD_SIZE else 0
+        if owner and owner != os.getpid() and _alive(owner):
+            _untrack(old)
+            old.close()
+            raise FileExistsError(f'다른 프로세스(pid {owner})가 이미 공유 보드를 쓰고 있습니다: {name}')
+        old.close()
+        old.unlink()
+        return shared_memory.SharedMemory(name=name, create=True, size=BOARD_SIZE)
+
+    def publish(self, timestamp, env_values):
+        self.seq[0] += 1  # 홀수: 쓰는 중
+        self.data[0] = timestamp
+        for index, name in enumerate(CHANNELS, start=1):
+            self.data[index] = env_values[name]
+        self.seq[0] += 1  # 짝수: 읽어도 됨
+
+    def close(self, unlink=True):
+        self.seq = None
+        self.data = None
+        self.shm.close()
+        if unlink:
+            try:
+                self.shm.unlink()
+            except FileNotFoundError:
+                pass
+
+
+class SharedBoardReader:
+    """
+    공유 메모리에서 최신 값을 읽는 쪽 (대시보드, 제어기 등 여러 프로세스).
+    IPC 왕복이나 JSON 변환 없이 메모리를 직접 읽고,
+    읽는 사이 순번이 바뀌었거나 홀수면 다시 읽어 일관된 값만 돌려준다.
+    """
+
+    def __init__(self, name=DEFAULT_NAME):
+        self.shm = _attach(name)
+        self.seq = np.ndarray((1,), dtype=np.uint64, buffer=self.shm.buf, offset=SEQ_OFFSET)
+        # 복사 없는 뷰 (일관성이 필요 없으면 바로 읽어도 됨)
+        self.view = np.ndarray((DATA_FIELDS,), dtype=np.float64, buffer=self.shm.buf, offset=DATA_OFFSET)
+
+    def read(self):
+        """(순번, 시각, 채널 값 배열 복사본) 을 반환. 아직 값이 없으면 순번 0"""
+        deadline = None
+        while True:
+            before = int(self.seq[0])
+            if not before % 2:
+                snapshot = self.view.copy()
+                if int(self.seq[0]) == before:
+                    return before // 2, float(snapshot[0]), snapshot[1:]
+            # 쓰는 쪽이 끝낼 수 있도록 CPU 를 양보하고 다시 시도
+            if deadline is None:
+                deadline = time.monotonic() + READ_TIMEOUT
+            elif time.monotonic() > deadline:
+                break
+            time.sleep(0)
+        raise TimeoutError('공유 보드 값을 일관되게 읽지 못했습니다.')
+
+    def read_env(self):
+        sequence, timestamp, values = self.read()
+        return sequence, timestamp, {name: float(value) for name, value in zip(CHANNELS, values)}
+
+    def close(self):
+        self.seq = None
+        self.view = None
+        self.shm.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='공유 메모리 env_values 보드 읽기')
+    parser.add_argument('--name', default=DEFAULT_NAME)
+    parser.add_argument('--interval', type=float, default=1.0, help='출력 주기 (초)')
+    args = parser.parse_args()
+
+    try:
+        reader = SharedBoardReader(args.name)
+    except FileNotFoundError:
+        print(f'공유 보드를 찾을 수 없습니다: {args.name} (MissionComputer 가 실행 중인지 확인하세요)')
+        return
+    except ValueError as e:
+        print(f'오류 발생: {e}')
+        return
+
+    last = -1
+    try:
+        while True:
+            sequence, timestamp, env_values = reader.read_env()
+            if sequence != last:
+                last = sequence
+                print(sequence, timestamp, env_values)
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        reader.close()
+
+
+if __name__ == '__main__':
+    main()
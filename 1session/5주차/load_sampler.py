@@ -0,0 +1,173 @@
+import os
+import threading
+import time
+from collections import deque
+
+import psutil
+
+# 기본 샘플링 주기 (초) 와 보관할 샘플 수 (1초 주기면 최근 5분)
+DEFAULT_INTERVAL = 1.0
+DEFAULT_HISTORY = 300
+
+# 평균을 낼 수 있는 숫자 항목
+NUMERIC_FIELDS = (
+    'cpu', 'memory', 'disk',
+    'disk_read_bps', 'disk_write_bps', 'net_sent_bps', 'net_recv_bps'
+)
+
+
+class LoadSampler:
+    """
+    백그라운드 스레드에서 주기적으로 시스템 부하를 재서 링 버퍼에 쌓는다.
+    - CPU 는 cpu_percent(interval=None) 로 직전 샘플 이후 사용률을 구하므로 기다리지 않음
+    - 디스크/네트워크 입출력은 누적 카운터의 차이를 초당 바이트로 환산
+    - latest() 는 마지막 샘플을 바로 돌려줌 (호출하는 쪽이 1초씩 막히지 않음)
+    - start() 에서 메모리/디스크는 바로 한 번 재 두므로 첫 주기 전에도 값이 있음
+      (이 첫 샘플은 CPU·입출력 속도를 잴 기준점이 없어 cpu_pending=True, 해당 값은 None)
+    - latest(measured=True) 는 첫 주기 샘플이 나올 때까지 한 번만 기다림 (그 뒤로는 바로 반환)
+    샘플은 {'timestamp', 'cpu', 'cpu_per_core', 'cpu_pending', 'memory', 'disk', 'disk_read_bps', ...} 형태.
+    """
+
+    def __init__(self, interval=DEFAULT_INTERVAL, history=DEFAULT_HISTORY, disk_path=None):
+        self.interval = interval
+        self.samples = deque(maxlen=history)
+        self.disk_path = disk_path or os.path.abspath(os.sep)
+        self.lock = threading.Lock()
+        self.ready = threading.Event()
+        self.measured = threading.Event()   # CPU 까지 잰 첫 샘플이 들어왔는지
+        self.stopped = threading.Event()
+        self.thread = None
+        self._last_time = None
+        self._last_disk = None
+        self._last_net = None
+
+    def start(self):
+        if self.thread is not None:
+            return self
+        # 첫 cpu_percent 호출은 기준점만 잡으므로 미리 한 번 불러 둠
+        psutil.cpu_percent(percpu=True)
+        self._last_time = time.monotonic()
+        self._last_disk = psutil.disk_io_counters()
+        self._last_net = psutil.net_io_counters()
+        # 첫 주기를 기다리지 않도록 지금 잴 수 있는 값만으로 첫 샘플을 넣어 둠
+        self._collect(pending=True)
+        self.stopped.clear()
+        self.thread = threading.Thread(target=self._run, name='load-sampler', daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.stopped.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def _run(self):
+        # 작업 시간만큼 밀리지 않도록 '시작 + k x 주기' 절대 시각에 맞춰 잼
+        deadline = time.monotonic()
+        while True:
+            deadline += self.interval
+            if self.stopped.wait(max(0.0, deadline - time.monotonic())):
+                break
+            self._collect()
+
+    def _collect(self, pending=False):
+        try:
+            sample = self.sample(pending)
+        except Exception as e:
+            sample = {'timestamp': time.time(), 'error': f'부하 정보를 가져오는 중 오류 발생: {e}'}
+        with self.lock:
+            self.samples.append(sample)
+        self.ready.set()
+        if not pending:
+            self.measured.set()
+
+    def sample(self, pending=False):
+        # pending 이면 기준점을 건드리지 않고 메모리/디스크 사용률만 잼 (CPU·입출력 속도는 None)
+        if pending:
+            return {
+                'timestamp': time.time(),
+                'cpu': None,
+                'cpu_per_core': None,
+                'cpu_pending': True,
+                'memory': psutil.virtual_memory().percent,
+                'disk': psutil.disk_usage(self.disk_path).percent,
+                'disk_read_bps': None,
+                'disk_write_bps': None,
+                'net_sent_bps': None,
+                'net_recv_bps': None
+            }
+
+        now = time.monotonic()
+        elapsed = max(now - self._last_time, 1e-9)
+        per_core = psutil.cpu_percent(percpu=True)
+        disk = psutil.disk_io_counters()
+        net = psutil.net_io_counters()
+
+        sample = {
+            'timestamp': time.time(),
+            'cpu': round(sum(per_core) / len(per_core), 1) if per_core else 0.0,
+            'cpu_per_core': per_core,
+            'cpu_pending': False,
+            'memory': psutil.virtual_memory().percent,
+            'disk': psutil.disk_usage(self.disk_path).percent,
+            # 카운터를 제공하지 않는 환경이면 None
+            'disk_read_bps': None,
+            'disk_write_bps': None,
+            'net_sent_bps': None,
+            'net_recv_bps': None
+        }
+        if disk and self._last_disk:
+            sample['disk_read_bps'] = round((disk.read_bytes - self._last_disk.read_bytes) / elapsed, 1)
+            sample['disk_write_bps'] = round((disk.write_bytes - self._last_disk.write_bytes) / elapsed, 1)
+        if net and self._last_net:
+            sample['net_sent_bps'] = round((net.bytes_sent - self._last_net.bytes_sent) / elapsed, 1)
+            sample['net_recv_bps'] = round((net.bytes_recv - self._last_net.bytes_recv) / elapsed, 1)
+
+        self._last_time = now
+        self._last_disk = disk
+        self._last_net = net
+        return sample
+
+    def latest(self, timeout=None, measured=False):
+        """
+        마지막 샘플. 아직 하나도 없으면 첫 샘플을 timeout 초까지 기다림
+        (None 이면 두 주기만큼). 그래도 없으면 None.
+        measured 면 CPU 를 아직 못 잰 첫 샘플 대신 첫 주기 샘플을 기다림.
+        """
+        event = self.measured if measured else self.ready
+        if not event.is_set():
+            event.wait(self.interval * 2 if timeout is None else timeout)
+        with self.lock:
+            return self.samples[-1] if self.samples else None
+
+    def history(self, seconds=None):
+        # 최근 seconds 초 동안의 샘플 (None 이면 링 버퍼 전체), 오래된 것부터
+        with self.lock:
+            samples = list(self.samples)
+        if seconds is None:
+            return samples
+        since = time.time() - seconds
+        return [sample for sample in samples if sample['timestamp'] >= since]
+
+    def averages(self, seconds=None):
+        """최근 seconds 초 샘플의 항목별 평균 (코어별 CPU 는 코어마다 평균)"""
+        samples = [sample for sample in self.history(seconds) if 'error' not in sample]
+        if not samples:
+            return None
+        result = {'samples': len(samples)}
+        for field in NUMERIC_FIELDS:
+            values = [sample[field] for sample in samples if sample[field] is not None]
+            result[field] = round(sum(values) / len(values), 1) if values else None
+        result['cpu_per_core'] = [
+            round(sum(column) / len(column), 1)
+            for column in zip(*(sample['cpu_per_core'] for sample in samples
+                                if sample['cpu_per_core'] is not None))
+        ]
+        return result
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -3,9 +3,22 @@ import psutil
 import json
 import os
 
+from load_sampler import LoadSampler, DEFAULT_INTERVAL
+
+#설정 항목 이름 → 부하 샘플의 항목
+LOAD_FIELDS = {
+    "CPU 실시간 사용량(%)": "cpu",
+    "코어별 CPU 사용량(%)": "cpu_per_core",
+    "메모리 실시간 사용량(%)": "memory",
+    "디스크 사용량(%)": "disk"
+}
+
 class MissionComputer:
-    def __init__(self):
+    def __init__(self, sample_interval=None):
         self.settings = self.load_settings()
+        #부하 정보는 백그라운드에서 미리 재 두고 조회할 때는 마지막 값만 꺼냄
+        interval = sample_interval or self.settings.get("부하 샘플링 주기(초)", DEFAULT_INTERVAL)
+        self.sampler = LoadSampler(interval=interval).start()
 
     #필요한 미션 컴퓨터의 시스템 정보
     def load_settings(self):
@@ -16,7 +29,12 @@ class MissionComputer:
             "CPU 코어 수": True,
             "메모리 크기(GB)": True,
             "CPU 실시간 사용량(%)": True,
-            "메모리 실시간 사용량(%)": True
+            "메모리 실시간 사용량(%)": True,
+            "코어별 CPU 사용량(%)": True,
+            "디스크 사용량(%)": True,
+            "디스크 읽기/쓰기(B/s)": True,
+            "네트워크 송신/수신(B/s)": True,
+            "부하 샘플링 주기(초)": DEFAULT_INTERVAL
         }
         #추가문제 출력 정보의 항목을 세팅 가능
         if not os.path.exists("./5주차/setting.txt"):
@@ -46,14 +64,48 @@ class MissionComputer:
             info["오류"] = f"시스템 정보를 가져오는 중 오류 발생: {str(e)}"
         return json.dumps(info, indent=4, ensure_ascii=False)
 
-    # CPU, 메모리 정보 가져오기
-    def get_mission_computer_load(self):
+    #샘플 하나를 설정에서 켠 항목만 골라 출력용 사전으로 바꿈
+    def format_load(self, sample):
+        if sample is None:
+            return {"오류": "부하 정보가 아직 수집되지 않았습니다."}
+        if "error" in sample:
+            return {"오류": sample["error"]}
         load = {}
-        if self.settings.get("CPU 실시간 사용량(%)", False):
-            load["CPU 실시간 사용량(%)"] = psutil.cpu_percent(interval=1)
-        if self.settings.get("메모리 실시간 사용량(%)", False):
-            load["메모리 실시간 사용량(%)"] = psutil.virtual_memory().percent
+        for key, field in LOAD_FIELDS.items():
+            if self.settings.get(key, False):
+                load[key] = sample[field]
+        # 시작 직후 첫 샘플은 CPU 사용률을 잴 기준점만 있는 상태
+        if sample.get("cpu_pending"):
+            for key in ("CPU 실시간 사용량(%)", "코어별 CPU 사용량(%)"):
+                if key in load:
+                    load[key] = "측정 중"
+        if self.settings.get("디스크 읽기/쓰기(B/s)", False):
+            load["디스크 읽기/쓰기(B/s)"] = {"읽기": sample["disk_read_bps"], "쓰기": sample["disk_write_bps"]}
+        if self.settings.get("네트워크 송신/수신(B/s)", False):
+            load["네트워크 송신/수신(B/s)"] = {"송신": sample["net_sent_bps"], "수신": sample["net_recv_bps"]}
+        return load
+
+    # CPU, 메모리 등 부하 정보 가져오기 (백그라운드 샘플러의 최신 값)
+    # 시작 직후 한 번만 첫 주기 샘플을 기다리고, 그 뒤로는 기다리지 않음
+    def get_mission_computer_load(self):
+        load = self.format_load(self.sampler.latest(measured=True))
+        return json.dumps(load, indent=4, ensure_ascii=False)
 
+    #최근 seconds 초 동안의 부하 기록
+    def get_mission_computer_load_history(self, seconds=60):
+        history = []
+        for sample in self.sampler.history(seconds):
+            load = self.format_load(sample)
+            load["시각"] = sample["timestamp"]
+            history.append(load)
+        return json.dumps(history, indent=4, ensure_ascii=False)
+
+    #최근 seconds 초 동안의 부하 평균
+    def get_mission_computer_load_average(self, seconds=60):
+        averages = self.sampler.averages(seconds)
+        load = self.format_load(averages)
+        if averages:
+            load["샘플 수"] = averages["samples"]
         return json.dumps(load, indent=4, ensure_ascii=False)
 
 
@@ -66,3 +118,5 @@ if __name__ == "__main__":
 
     print("\n=== 미션 컴퓨터 부하 정보 ===")
     print(runComputer.get_mission_computer_load())
+
+    runComputer.sampler.stop()